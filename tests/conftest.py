@@ -0,0 +1,21 @@
+"""Shared pytest configuration for the test suite.
+
+Registers the Hypothesis profiles used by the property-based tests. The
+"dev" profile is the default; set HYPOTHESIS_PROFILE=ci for a faster,
+reproducible run that generates fewer examples and skips shrinking.
+"""
+
+import os
+
+from hypothesis import Phase, settings
+
+
+settings.register_profile("dev", max_examples=100)
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    derandomize=True,
+    deadline=None,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate),
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
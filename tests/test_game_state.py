@@ -6,7 +6,7 @@ This module contains tests for the GameState class, including:
 """
 
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 
 from tetris.models.game_state import GameState
 from tetris.models.tetromino import Tetromino
@@ -78,6 +78,30 @@ def test_spawn_tetromino_random_types():
     assert len(types_seen) > 1, f"Only saw types: {types_seen}"
 
 
+def test_spawn_tetromino_uses_each_type_once_per_bag():
+    """Test that every seven consecutive spawns contain all seven types."""
+    game_state = GameState()
+    
+    for _ in range(3):
+        bag = []
+        for _ in range(7):
+            bag.append(game_state.spawn_tetromino().shape_type)
+        assert sorted(bag) == sorted(['I', 'O', 'T', 'L', 'J', 'S', 'Z'])
+
+
+def test_reset_starts_a_new_bag():
+    """Test that reset discards the rest of the current bag."""
+    game_state = GameState()
+    game_state.spawn_tetromino()
+    
+    game_state.reset()
+    
+    bag = []
+    for _ in range(7):
+        bag.append(game_state.spawn_tetromino().shape_type)
+    assert sorted(bag) == sorted(['I', 'O', 'T', 'L', 'J', 'S', 'Z'])
+
+
 def test_move_active_left_success():
     """Test moving active tetromino left when valid."""
     game_state = GameState()
@@ -481,7 +505,6 @@ def playfield_with_blocks(draw):
 class TestGameStateProperties:
     """Property-based tests for GameState invariants."""
     
-    @settings(max_examples=100)
     @given(shape_type=tetromino_type())
     def test_property_12_post_lock_spawning(self, shape_type):
         """Property 12: Post-Lock Spawning.
@@ -517,7 +540,6 @@ class TestGameStateProperties:
             assert game_state.active_tetromino.shape_type in ['I', 'O', 'T', 'L', 'J', 'S', 'Z'], \
                 f"Invalid tetromino type: {game_state.active_tetromino.shape_type}"
     
-    @settings(max_examples=100)
     @given(
         shape_type=tetromino_type(),
         x=st.integers(min_value=1, max_value=8),
@@ -577,7 +599,6 @@ class TestGameStateProperties:
             assert game_state.active_tetromino.y == original_y, \
                 f"After failed move, y should remain {original_y}, got {game_state.active_tetromino.y}"
     
-    @settings(max_examples=100)
     @given(
         shape_type=tetromino_type(),
         x=st.integers(min_value=2, max_value=7),
@@ -629,7 +650,6 @@ class TestGameStateProperties:
         assert game_state.playfield.is_valid_position(game_state.active_tetromino), \
             "After rotation attempt, tetromino should be in a valid position"
     
-    @settings(max_examples=100)
     @given(
         shape_type=tetromino_type(),
         x=st.integers(min_value=2, max_value=7),
@@ -680,7 +700,6 @@ class TestGameStateProperties:
         assert blocks_found > 0, \
             f"After hard drop, expected blocks at y={lowest_y} should be in playfield"
     
-    @settings(max_examples=100)
     @given(
         shape_type=tetromino_type(),
         x=st.integers(min_value=2, max_value=7),
@@ -724,7 +743,6 @@ class TestGameStateProperties:
                 assert cell_color == color_before, \
                     f"Block at ({block_x}, {block_y}) should have color {color_before}, got {cell_color}"
     
-    @settings(max_examples=100)
     @given(
         actions=st.lists(
             st.sampled_from(['spawn', 'move_left', 'move_right', 'rotate', 'drop']),
@@ -769,7 +787,6 @@ class TestGameStateProperties:
             
             previous_score = game_state.score
     
-    @settings(max_examples=100)
     @given(
         shape_type=tetromino_type(),
         x=st.integers(min_value=2, max_value=7),
@@ -811,7 +828,6 @@ class TestGameStateProperties:
             assert game_state.score >= score_before + 4, \
                 f"After locking with line clears, score should be at least {score_before + 4}, got {game_state.score}"
     
-    @settings(max_examples=100)
     @given(
         num_rows=st.integers(min_value=1, max_value=4),
         start_row=st.integers(min_value=10, max_value=16)
@@ -872,7 +888,6 @@ class TestGameStateProperties:
             assert score_increase == 4 + (rows_cleared * 10), \
                 f"Score increase {score_increase} should equal 4 + ({rows_cleared} * 10)"
     
-    @settings(max_examples=100)
     @given(shape_type=tetromino_type())
     def test_property_20_game_over_detection(self, shape_type):
         """Property 20: Game Over Detection.
@@ -903,7 +918,6 @@ class TestGameStateProperties:
         # Now playfield should detect game over
         assert game_state.playfield.is_game_over() is True
     
-    @settings(max_examples=100)
     @given(
         actions=st.lists(
             st.sampled_from(['move_left', 'move_right', 'rotate', 'spawn']),
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import List
 
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 
 from tetris.models.high_scores import HighScoreEntry, HighScoreManager
 from tests.strategies import high_score_entry, high_score_list, player_name, score_value
@@ -137,6 +137,31 @@ class TestLoadAndSave:
         assert manager2.scores[1].score == 1000
         assert manager2.scores[2].score == 800
     
+    def test_save_replaces_file_without_leaving_temp_file(self, high_score_manager):
+        """Test that save writes through a temporary file that is then renamed."""
+        high_score_manager.add_score("Alice", 1000)
+        high_score_manager.save()
+        
+        assert not os.path.exists(high_score_manager.file_path + '.tmp')
+        with open(high_score_manager.file_path) as f:
+            assert json.load(f)[0]["name"] == "Alice"
+    
+    def test_failed_save_keeps_existing_file(self, high_score_manager, monkeypatch):
+        """Test that a save that fails midway leaves the previous file intact."""
+        high_score_manager.add_score("Alice", 1000)
+        high_score_manager.save()
+        
+        def failing_dump(*args, **kwargs):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr('tetris.models.high_scores.json.dump', failing_dump)
+        high_score_manager.add_score("Bob", 2000)
+        high_score_manager.save()
+        
+        assert not os.path.exists(high_score_manager.file_path + '.tmp')
+        manager2 = HighScoreManager(file_path=high_score_manager.file_path)
+        assert [entry.name for entry in manager2.scores] == ["Alice"]
+    
     def test_load_corrupted_json(self, temp_high_score_file):
         """Test loading corrupted JSON file."""
         # Write invalid JSON
@@ -146,6 +171,34 @@ class TestLoadAndSave:
         # Should handle gracefully
         manager = HighScoreManager(file_path=temp_high_score_file)
         assert manager.scores == []
+    
+    def test_load_sorts_unsorted_file(self, temp_high_score_file):
+        """Test that an unsorted file is loaded in rank order before adding scores."""
+        entries = [
+            {"name": "a", "score": 100, "timestamp": "2024-01-01T00:00:00"},
+            {"name": "b", "score": 900, "timestamp": "2024-01-02T00:00:00"},
+            {"name": "c", "score": 500, "timestamp": "2024-01-03T00:00:00"},
+        ]
+        with open(temp_high_score_file, 'w') as f:
+            json.dump(entries, f)
+        
+        manager = HighScoreManager(file_path=temp_high_score_file)
+        assert [entry.name for entry in manager.scores] == ["b", "c", "a"]
+        
+        manager.add_score("d", 700)
+        assert [entry.name for entry in manager.scores] == ["b", "d", "c", "a"]
+    
+    def test_load_keeps_only_top_10(self, temp_high_score_file):
+        """Test that loading a file with more than 10 entries keeps the best 10."""
+        entries = [
+            {"name": f"P{i}", "score": i * 100, "timestamp": "2024-01-01T00:00:00"}
+            for i in range(12)
+        ]
+        with open(temp_high_score_file, 'w') as f:
+            json.dump(entries, f)
+        
+        manager = HighScoreManager(file_path=temp_high_score_file)
+        assert [entry.score for entry in manager.scores] == [i * 100 for i in range(11, 1, -1)]
 
 
 # ============================================================================
@@ -200,6 +253,14 @@ class TestHighScoreManagement:
         assert high_score_manager.scores[1].score == 750
         assert high_score_manager.scores[2].score == 500
     
+    def test_add_score_places_equal_scores_after_existing(self, high_score_manager):
+        """Test that a new score ranks below earlier entries with the same score."""
+        high_score_manager.add_score("Alice", 500)
+        high_score_manager.add_score("Bob", 1000)
+        high_score_manager.add_score("Carol", 500)
+        
+        assert [entry.name for entry in high_score_manager.scores] == ["Bob", "Alice", "Carol"]
+    
     def test_add_score_limits_to_10(self, high_score_manager):
         """Test that list never exceeds 10 entries."""
         # Add 15 scores
@@ -244,6 +305,15 @@ class TestHighScoreManagement:
         assert top_5[0].score == 1000
         assert top_5[4].score == 600
     
+    def test_get_top_scores_returns_independent_list(self, high_score_manager):
+        """Test that modifying the returned list does not affect the manager."""
+        high_score_manager.add_score("Alice", 1000)
+        
+        top_scores = high_score_manager.get_top_scores()
+        top_scores.clear()
+        
+        assert [entry.name for entry in high_score_manager.get_top_scores()] == ["Alice"]
+    
     def test_timestamp_is_set(self, high_score_manager):
         """Test that timestamp is automatically set when adding score."""
         before = datetime.now()
@@ -263,7 +333,6 @@ class TestHighScoreManagement:
 class TestHighScoreProperties:
     """Property-based tests for high score invariants."""
     
-    @settings(max_examples=100)
     @given(scores=high_score_list(min_size=1, max_size=10))
     def test_property_23_high_score_persistence_round_trip(self, scores):
         """Property 23: Saving and loading preserves high score list.
@@ -289,8 +358,10 @@ class TestHighScoreProperties:
                 f"Expected {len(scores)} entries, got {len(manager2.scores)}"
             )
             
-            # Verify each entry matches
-            for i, (original, loaded) in enumerate(zip(scores, manager2.scores)):
+            # Verify each entry matches, in rank order (load sorts by score
+            # descending and keeps the saved order for equal scores)
+            expected = sorted(scores, key=lambda entry: -entry.score)
+            for i, (original, loaded) in enumerate(zip(expected, manager2.scores)):
                 assert loaded.name == original.name, (
                     f"Entry {i}: name mismatch - expected {original.name}, got {loaded.name}"
                 )
@@ -305,7 +376,6 @@ class TestHighScoreProperties:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
     
-    @settings(max_examples=100)
     @given(scores=high_score_list(min_size=0, max_size=15))
     def test_property_22_high_score_list_size_limit(self, scores):
         """Property 22: High score list never exceeds 10 entries.
@@ -333,7 +403,6 @@ class TestHighScoreProperties:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
     
-    @settings(max_examples=100)
     @given(
         existing_scores=high_score_list(min_size=0, max_size=10),
         new_score=score_value()
@@ -373,7 +442,6 @@ class TestHighScoreProperties:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
     
-    @settings(max_examples=100)
     @given(
         existing_scores=high_score_list(min_size=0, max_size=9),
         name=player_name(),
@@ -417,7 +485,6 @@ class TestHighScoreProperties:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
     
-    @settings(max_examples=100)
     @given(scores=high_score_list(min_size=2, max_size=15))
     def test_property_26_high_score_sorting_invariant(self, scores):
         """Property 26: High score list is always sorted descending by score.
@@ -447,7 +514,6 @@ class TestHighScoreProperties:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
     
-    @settings(max_examples=100)
     @given(scores=high_score_list(min_size=1, max_size=10))
     def test_property_27_high_score_entry_completeness(self, scores):
         """Property 27: All high score entries have valid name and score.
@@ -284,3 +284,14 @@ def test_handle_event_routes_to_menu_input_on_high_scores_screen(input_handler,
     
     # Should return to START screen
     mock_ui_manager.transition_to.assert_called_once_with(Screen.START)
+
+
+def test_handle_event_ignores_input_during_game_over_overlay(input_handler, mock_game_state, mock_ui_manager):
+    """Test that SPACE during the game over overlay neither moves nor transitions."""
+    mock_ui_manager.current_screen = Screen.GAME_OVER_OVERLAY
+    event = create_keydown_event(pygame.K_SPACE)
+    
+    input_handler.handle_event(event, mock_game_state, mock_ui_manager)
+    
+    mock_game_state.rotate_active.assert_not_called()
+    mock_ui_manager.transition_to.assert_not_called()
@@ -11,6 +11,12 @@ from hypothesis import given, settings, strategies as st
 from tetris.models.playfield import Playfield, PLAYFIELD_WIDTH, PLAYFIELD_HEIGHT
 
 
+# Shared Hypothesis settings for the property tests in this module. The
+# playfield operations under test are cheap, so per-example deadline timing
+# only adds overhead; the loaded profile (see conftest.py) decides the rest.
+FAST_SETTINGS = settings(deadline=None)
+
+
 # ============================================================================
 # Unit Tests
 # ============================================================================
@@ -66,6 +72,21 @@ def test_set_cell_to_none_clears_cell():
     assert playfield.get_cell(3, 7) is None
 
 
+def test_cells_store_interned_color_ids():
+    """Test that equal colors share one interned id and read back as tuples."""
+    playfield = Playfield()
+    
+    playfield.set_cell(0, 0, (10, 20, 30))
+    playfield.set_cell(1, 0, (10, 20, 30))
+    playfield.set_cell(2, 0, (30, 20, 10))
+    
+    assert playfield.cells[0] == playfield.cells[1]
+    assert playfield.cells[0] != playfield.cells[2]
+    assert playfield.cells[3] == 0  # Empty cell
+    assert playfield.get_cell(1, 0) == (10, 20, 30)
+    assert playfield.get_cell(2, 0) == (30, 20, 10)
+
+
 def test_get_cell_out_of_bounds_raises_error():
     """Test that accessing out-of-bounds cells raises IndexError."""
     playfield = Playfield()
@@ -124,6 +145,70 @@ def test_boundary_cells_accessible():
     assert playfield.get_cell(9, 19) == color
 
 
+def test_fill_row_sets_every_cell():
+    """Test that fill_row sets all cells in a row and leaves other rows alone."""
+    playfield = Playfield()
+    color = (255, 0, 0)  # Red
+    
+    playfield.fill_row(19, color)
+    
+    for x in range(10):
+        assert playfield.get_cell(x, 19) == color
+        assert playfield.get_cell(x, 18) is None
+    assert playfield.get_complete_rows() == [19]
+    
+    # Filling with None clears the row again
+    playfield.fill_row(19, None)
+    for x in range(10):
+        assert playfield.get_cell(x, 19) is None
+
+
+def test_fill_row_out_of_bounds_raises_error():
+    """Test that filling an out-of-bounds row raises IndexError."""
+    playfield = Playfield()
+    
+    with pytest.raises(IndexError):
+        playfield.fill_row(-1, (255, 0, 0))
+    
+    with pytest.raises(IndexError):
+        playfield.fill_row(20, (255, 0, 0))
+
+
+def test_get_occupied_cells():
+    """Test that get_occupied_cells lists every occupied cell in row-major order."""
+    playfield = Playfield()
+    assert playfield.get_occupied_cells() == []
+    
+    playfield.set_cell(9, 0, (0, 0, 255))
+    playfield.set_cell(5, 10, (0, 255, 0))
+    playfield.set_cell(0, 10, (255, 0, 0))
+    playfield.fill_row(19, (255, 255, 0))
+    playfield.set_cell(3, 19, None)
+    
+    expected = [(9, 0, (0, 0, 255)), (0, 10, (255, 0, 0)), (5, 10, (0, 255, 0))]
+    expected += [(x, 19, (255, 255, 0)) for x in range(10) if x != 3]
+    assert playfield.get_occupied_cells() == expected
+
+
+def test_take_dirty_cells_tracks_changes():
+    """Test that take_dirty_cells reports changed cells once and then resets."""
+    from tetris.models.tetromino import Tetromino
+    
+    playfield = Playfield()
+    assert playfield.take_dirty_cells() == set()
+    
+    playfield.set_cell(2, 5, (255, 0, 0))
+    playfield.add_tetromino(Tetromino(shape_type='O', x=0, y=17, rotation=0))
+    assert playfield.take_dirty_cells() == {(2, 5), (0, 17), (1, 17), (0, 18), (1, 18)}
+    assert playfield.take_dirty_cells() == set()
+    
+    # Clearing a row shifts every row above it, so all of them are dirty
+    playfield.fill_row(10, (0, 255, 0))
+    playfield.take_dirty_cells()
+    playfield.clear_rows([10])
+    assert playfield.take_dirty_cells() == {(x, y) for y in range(11) for x in range(10)}
+
+
 def test_is_valid_position_empty_playfield():
     """Test that tetrominoes in valid positions are accepted on empty playfield."""
     from tetris.models.tetromino import Tetromino
@@ -254,6 +339,86 @@ def test_is_valid_position_complex_collision():
     assert playfield.is_valid_position(tetromino) is False
 
 
+def test_collides_matches_block_by_block_check():
+    """Test that the row bitmap overlap check agrees with checking each block."""
+    from tetris.models.tetromino import Tetromino, TETROMINO_SHAPES
+    
+    playfield = Playfield()
+    for x, y in [(0, 19), (3, 18), (4, 18), (9, 17), (0, 12), (7, 5), (8, 5)]:
+        playfield.set_cell(x, y, (255, 0, 0))
+    
+    for shape_type in TETROMINO_SHAPES:
+        for rotation in range(4):
+            # x starts at -1 so pieces with an empty first column are included
+            for x in range(-1, playfield.width):
+                for y in range(playfield.height):
+                    tetromino = Tetromino(shape_type=shape_type, x=x, y=y, rotation=rotation)
+                    blocks = tetromino.get_absolute_blocks()
+                    if not all(0 <= bx < playfield.width and 0 <= by < playfield.height
+                               for bx, by in blocks):
+                        continue
+                    
+                    expected = any(playfield.get_cell(bx, by) is not None for bx, by in blocks)
+                    assert playfield.collides(tetromino) is expected, \
+                        f"collides disagrees for {tetromino}"
+
+
+def test_is_valid_position_offset_matches_moved_tetromino():
+    """Test that checking with an offset agrees with checking the moved tetromino."""
+    from tetris.models.tetromino import Tetromino, TETROMINO_SHAPES
+    
+    playfield = Playfield()
+    for x, y in [(0, 19), (3, 18), (4, 18), (9, 17), (0, 12), (7, 5), (8, 5)]:
+        playfield.set_cell(x, y, (255, 0, 0))
+    
+    for shape_type in TETROMINO_SHAPES:
+        for rotation in range(4):
+            for x in range(-1, playfield.width):
+                for y in range(-1, playfield.height):
+                    tetromino = Tetromino(shape_type=shape_type, x=x, y=y, rotation=rotation)
+                    for dx, dy in [(-1, 0), (1, 0), (0, 1)]:
+                        expected = playfield.is_valid_position(tetromino.move(dx, dy))
+                        assert playfield.is_valid_position(tetromino, dx, dy) is expected, \
+                            f"offset ({dx}, {dy}) disagrees for {tetromino}"
+
+
+def test_drop_distance_matches_stepwise_drop():
+    """Test that drop_distance agrees with moving down one row at a time."""
+    from tetris.models.tetromino import Tetromino, TETROMINO_SHAPES
+    
+    playfield = Playfield()
+    for x, y in [(0, 19), (1, 19), (3, 18), (4, 15), (9, 12), (6, 8), (2, 4)]:
+        playfield.set_cell(x, y, (255, 0, 0))
+    
+    for shape_type in TETROMINO_SHAPES:
+        for rotation in range(4):
+            for x in range(-2, playfield.width):
+                for y in range(-3, playfield.height):
+                    tetromino = Tetromino(shape_type=shape_type, x=x, y=y, rotation=rotation)
+                    
+                    expected = 0
+                    while playfield.is_valid_position(tetromino.move(0, expected + 1)):
+                        expected += 1
+                    
+                    assert playfield.drop_distance(tetromino) == expected, \
+                        f"drop_distance disagrees for {tetromino}"
+
+
+def test_is_valid_position_is_deterministic():
+    """Test that repeated collision checks on the same state agree."""
+    from tetris.models.tetromino import Tetromino
+    
+    playfield = Playfield()
+    playfield.set_cell(6, 11, (255, 0, 0))
+    
+    for tetromino, expected in (
+        (Tetromino(shape_type='T', x=5, y=10, rotation=0), False),  # Collides at (6, 11)
+        (Tetromino(shape_type='T', x=1, y=10, rotation=0), True),   # Free
+    ):
+        assert playfield.is_valid_position(tetromino) is expected
+        assert playfield.is_valid_position(tetromino) is expected
+
+
 def test_add_tetromino_basic():
     """Test that add_tetromino locks blocks into the grid with correct colors."""
     from tetris.models.tetromino import Tetromino
@@ -503,6 +668,24 @@ def test_get_complete_rows_top_row():
     assert complete_rows == [0]
 
 
+def test_clear_complete_rows():
+    """Test that clear_complete_rows clears only complete rows and counts them."""
+    playfield = Playfield()
+    assert playfield.clear_complete_rows() == 0
+    
+    playfield.fill_row(19, (255, 0, 0))
+    playfield.fill_row(17, (0, 255, 0))
+    playfield.set_cell(3, 18, (0, 0, 255))
+    
+    assert playfield.clear_complete_rows() == 2
+    assert playfield.get_complete_rows() == []
+    
+    # The partial row dropped to the bottom; everything above it is empty
+    assert playfield.get_cell(3, 19) == (0, 0, 255)
+    assert playfield.filled_count[19] == 1
+    assert all(count == 0 for count in playfield.filled_count[:19])
+
+
 def test_clear_rows_empty_list():
     """Test that clear_rows with empty list does nothing."""
     playfield = Playfield()
@@ -519,6 +702,24 @@ def test_clear_rows_empty_list():
     assert playfield.get_cell(3, 15) == (0, 255, 0)
 
 
+@pytest.mark.parametrize("row_indices", [[25], [-1], [19, 20], [-1, 5]])
+def test_clear_rows_out_of_bounds_leaves_playfield_unchanged(row_indices):
+    """Test that an out-of-bounds row raises before any row is removed."""
+    playfield = Playfield()
+    playfield.set_cell(5, 19, (255, 0, 0))
+    playfield.fill_row(18, (0, 255, 0))
+    cells = list(playfield.cells)
+    filled_count = list(playfield.filled_count)
+    row_bits = list(playfield.row_bits)
+    
+    with pytest.raises(IndexError):
+        playfield.clear_rows(row_indices)
+    
+    assert playfield.cells == cells
+    assert playfield.filled_count == filled_count
+    assert playfield.row_bits == row_bits
+
+
 def test_clear_rows_single_row():
     """Test clearing a single complete row."""
     playfield = Playfield()
@@ -694,6 +895,28 @@ def test_clear_rows_complex_scenario():
             assert playfield.get_cell(x, 18) is None
 
 
+def test_row_state_mirrors_grid():
+    """Test that the row fill counts and bitmaps stay in sync with the grid."""
+    from tetris.models.tetromino import Tetromino
+    
+    playfield = Playfield()
+    playfield.set_cell(2, 5, (255, 0, 0))
+    playfield.fill_row(19, (0, 255, 0))
+    playfield.add_tetromino(Tetromino(shape_type='O', x=4, y=16, rotation=0))
+    playfield.set_cell(9, 19, None)
+    playfield.fill_row(18, (0, 0, 255))
+    playfield.clear_rows([18])
+    
+    for y in range(playfield.height):
+        filled = sum(playfield.get_cell(x, y) is not None for x in range(playfield.width))
+        assert playfield.filled_count[y] == filled, \
+            f"Row {y} fill count is {playfield.filled_count[y]}, expected {filled}"
+        
+        bits = sum(1 << x for x in range(playfield.width) if playfield.get_cell(x, y) is not None)
+        assert playfield.row_bits[y] == bits, \
+            f"Row {y} bitmap is {playfield.row_bits[y]:#x}, expected {bits:#x}"
+
+
 # ============================================================================
 # Property-Based Tests
 # ============================================================================
@@ -716,13 +939,12 @@ def rgb_color():
     )
 
 
-@settings(max_examples=100)
-@given(position=valid_position())
-def test_property_1_playfield_dimensions_invariant(position):
+def test_property_1_playfield_dimensions_invariant():
     """Property 1: Playfield Dimensions Invariant.
     
     For any Playfield instance, the grid dimensions shall always be
-    exactly 10 columns and 20 rows.
+    exactly 10 columns and 20 rows. The dimensions do not depend on any
+    input, so a single example covers the property.
     
     Feature: tetris-clone, Property 1: Playfield Dimensions Invariant
     Validates: Requirements 1.1
@@ -733,13 +955,13 @@ def test_property_1_playfield_dimensions_invariant(position):
     assert playfield.width == 10, f"Width is {playfield.width}, expected 10"
     assert playfield.height == 20, f"Height is {playfield.height}, expected 20"
     
-    # Grid structure matches dimensions
-    assert len(playfield.grid) == 20, f"Grid has {len(playfield.grid)} rows, expected 20"
-    for row in playfield.grid:
-        assert len(row) == 10, f"Row has {len(row)} columns, expected 10"
+    # Cell storage matches dimensions
+    assert len(playfield.cells) == 200, f"Grid has {len(playfield.cells)} cells, expected 200"
+    assert len(playfield.row_bits) == 20, \
+        f"Row bitmaps cover {len(playfield.row_bits)} rows, expected 20"
 
 
-@settings(max_examples=100)
+@settings(FAST_SETTINGS, max_examples=25)
 @given(position=valid_position(), color=st.one_of(st.none(), rgb_color()))
 def test_property_2_playfield_state_accessibility(position, color):
     """Property 2: Playfield State Accessibility.
@@ -772,10 +994,9 @@ def test_property_2_playfield_state_accessibility(position, color):
             assert 0 <= component <= 255, f"Color component {component} out of range [0, 255]"
 
 
-@settings(max_examples=100)
-@given(
-    shape_type=st.sampled_from(['I', 'O', 'T', 'L', 'J', 'S', 'Z']),
-    rotation=st.integers(min_value=0, max_value=3)
+@pytest.mark.parametrize(
+    "shape_type,rotation",
+    [(shape_type, rotation) for shape_type in 'IOTLJSZ' for rotation in range(4)]
 )
 def test_property_3_boundary_collision_prevention(shape_type, rotation):
     """Property 3: Boundary Collision Prevention.
@@ -784,6 +1005,8 @@ def test_property_3_boundary_collision_prevention(shape_type, rotation):
     tetromino beyond the left boundary (x < 0) or right boundary
     (x + width > 10) shall be prevented.
     
+    All 28 shape/rotation combinations are enumerated exhaustively.
+    
     Feature: tetris-clone, Property 3: Boundary Collision Prevention
     Validates: Requirements 1.5, 1.6, 3.5, 3.6
     """
@@ -791,23 +1014,23 @@ def test_property_3_boundary_collision_prevention(shape_type, rotation):
     
     playfield = Playfield()
     
-    # Test left boundary - tetromino far to the left should be invalid
-    tetromino = Tetromino(shape_type=shape_type, x=-5, y=10, rotation=rotation)
-    assert playfield.is_valid_position(tetromino) is False, \
-        f"Tetromino {shape_type} at x=-5 should be invalid (left boundary)"
-    
-    # Test right boundary - tetromino far to the right should be invalid
-    tetromino = Tetromino(shape_type=shape_type, x=15, y=10, rotation=rotation)
-    assert playfield.is_valid_position(tetromino) is False, \
-        f"Tetromino {shape_type} at x=15 should be invalid (right boundary)"
-    
-    # Test bottom boundary - tetromino far below should be invalid
-    tetromino = Tetromino(shape_type=shape_type, x=5, y=25, rotation=rotation)
-    assert playfield.is_valid_position(tetromino) is False, \
-        f"Tetromino {shape_type} at y=25 should be invalid (bottom boundary)"
-
-
-@settings(max_examples=100)
+    # Sweep a grid of positions around every edge, including positions far
+    # past the left (x=-5), right (x=15) and bottom (y=25) boundaries: on an
+    # empty playfield a position is valid exactly when all of its blocks are
+    # inside the field
+    for px in (-5, -4, -1, 0, 5, 6, 7, 9, 10, 12, 15):
+        for py in (-3, -1, 0, 10, 16, 17, 19, 20, 25):
+            tetromino = Tetromino(shape_type=shape_type, x=px, y=py, rotation=rotation)
+            in_bounds = all(
+                0 <= bx < PLAYFIELD_WIDTH and 0 <= by < PLAYFIELD_HEIGHT
+                for bx, by in tetromino.get_absolute_blocks()
+            )
+            assert playfield.is_valid_position(tetromino) is in_bounds, \
+                f"Tetromino {shape_type} at ({px}, {py}) should be " \
+                f"{'valid' if in_bounds else 'invalid'}"
+
+
+@FAST_SETTINGS
 @given(
     shape_type=st.sampled_from(['I', 'O', 'T', 'L', 'J', 'S', 'Z']),
     x=st.integers(min_value=1, max_value=8),
@@ -845,49 +1068,41 @@ def test_property_8_collision_detection_correctness(shape_type, x, y, rotation):
                 # Now the same position should be invalid
                 assert playfield.is_valid_position(tetromino) is False, \
                     f"Tetromino {shape_type} at ({x}, {y}) should be invalid after placing block at ({block_x}, {block_y})"
-    
-    # Test that empty playfield allows valid positions
-    empty_playfield = Playfield()
-    tetromino_center = Tetromino(shape_type=shape_type, x=5, y=10, rotation=rotation)
-    # This might be valid or invalid depending on the shape, but should be consistent
-    result1 = empty_playfield.is_valid_position(tetromino_center)
-    result2 = empty_playfield.is_valid_position(tetromino_center)
-    assert result1 == result2, "is_valid_position should be deterministic"
 
 
-@settings(max_examples=100)
-@given(
-    row_index=st.integers(min_value=0, max_value=PLAYFIELD_HEIGHT - 1),
-    num_filled=st.integers(min_value=0, max_value=PLAYFIELD_WIDTH)
-)
-def test_property_13_complete_row_detection(row_index, num_filled):
+@pytest.mark.parametrize("row_index", range(PLAYFIELD_HEIGHT))
+def test_property_13_complete_row_detection(row_index):
     """Property 13: Complete Row Detection.
     
     For any playfield state, a row at index y is complete if and only if
     all 10 positions in that row contain non-None color values.
     
+    Every row index is enumerated, and each row is filled one cell at a
+    time so every fill count from 0 to 10 is checked on the same playfield.
+    
     Feature: tetris-clone, Property 13: Complete Row Detection
     Validates: Requirements 5.1
     """
     playfield = Playfield()
     
-    # Fill num_filled cells in the row
-    for x in range(num_filled):
-        playfield.set_cell(x, row_index, (255, 0, 0))
-    
-    # Get complete rows
-    complete_rows = playfield.get_complete_rows()
-    
-    # Row should be complete if and only if all 10 cells are filled
-    if num_filled == PLAYFIELD_WIDTH:
-        assert row_index in complete_rows, \
-            f"Row {row_index} with all {PLAYFIELD_WIDTH} cells filled should be complete"
-    else:
-        assert row_index not in complete_rows, \
-            f"Row {row_index} with only {num_filled}/{PLAYFIELD_WIDTH} cells filled should not be complete"
+    for num_filled in range(PLAYFIELD_WIDTH + 1):
+        if num_filled > 0:
+            # Fill one more cell in the row
+            playfield.set_cell(num_filled - 1, row_index, (255, 0, 0))
+        
+        # Get complete rows
+        complete_rows = playfield.get_complete_rows()
+        
+        # Row should be complete if and only if all 10 cells are filled
+        if num_filled == PLAYFIELD_WIDTH:
+            assert row_index in complete_rows, \
+                f"Row {row_index} with all {PLAYFIELD_WIDTH} cells filled should be complete"
+        else:
+            assert row_index not in complete_rows, \
+                f"Row {row_index} with only {num_filled}/{PLAYFIELD_WIDTH} cells filled should not be complete"
 
 
-@settings(max_examples=100)
+@FAST_SETTINGS
 @given(
     rows_to_fill=st.lists(
         st.integers(min_value=0, max_value=PLAYFIELD_HEIGHT - 1),
@@ -909,8 +1124,7 @@ def test_property_14_row_clearing_empties_rows(rows_to_fill):
     
     # Fill the specified rows completely
     for row in rows_to_fill:
-        for x in range(PLAYFIELD_WIDTH):
-            playfield.set_cell(x, row, (255, 0, 0))
+        playfield.fill_row(row, (255, 0, 0))
     
     # Verify rows are complete
     complete_rows = playfield.get_complete_rows()
@@ -934,7 +1148,7 @@ def test_property_14_row_clearing_empties_rows(rows_to_fill):
                 f"Cell ({x}, {y}) should be empty after clearing {num_cleared} rows"
 
 
-@settings(max_examples=100)
+@FAST_SETTINGS
 @given(
     clear_row=st.integers(min_value=1, max_value=PLAYFIELD_HEIGHT - 1),
     blocks_above=st.lists(
@@ -958,8 +1172,6 @@ def test_property_15_row_clearing_gravity(clear_row, blocks_above, color):
     Feature: tetris-clone, Property 15: Row Clearing Gravity
     Validates: Requirements 5.3, 5.5
     """
-    from hypothesis import assume
-    
     playfield = Playfield()
     
     # Filter blocks to only those above the clear_row
@@ -970,8 +1182,7 @@ def test_property_15_row_clearing_gravity(clear_row, blocks_above, color):
         playfield.set_cell(x, y, color)
     
     # Fill the row to be cleared completely
-    for x in range(PLAYFIELD_WIDTH):
-        playfield.set_cell(x, clear_row, (128, 128, 128))
+    playfield.fill_row(clear_row, (128, 128, 128))
     
     # Record the positions and colors of blocks above the cleared row
     blocks_before = {}
@@ -993,7 +1204,7 @@ def test_property_15_row_clearing_gravity(clear_row, blocks_above, color):
             f"Top row cell ({x}, 0) should be empty after clearing a row"
 
 
-@settings(max_examples=100)
+@FAST_SETTINGS
 @given(
     num_rows_to_clear=st.integers(min_value=1, max_value=4),
     start_row=st.integers(min_value=0, max_value=PLAYFIELD_HEIGHT - 4)
@@ -1008,11 +1219,8 @@ def test_property_16_multiple_row_clearing(num_rows_to_clear, start_row):
     Feature: tetris-clone, Property 16: Multiple Row Clearing
     Validates: Requirements 5.4
     """
-    from hypothesis import assume
-    
-    # Ensure we don't go out of bounds
-    assume(start_row + num_rows_to_clear <= PLAYFIELD_HEIGHT)
-    
+    # start_row is capped at PLAYFIELD_HEIGHT - 4, so every drawn example
+    # stays in bounds without filtering
     playfield = Playfield()
     
     # Create rows to clear (consecutive for simplicity)
@@ -1020,8 +1228,7 @@ def test_property_16_multiple_row_clearing(num_rows_to_clear, start_row):
     
     # Fill these rows completely
     for row in rows_to_clear:
-        for x in range(PLAYFIELD_WIDTH):
-            playfield.set_cell(x, row, (255, 0, 0))
+        playfield.fill_row(row, (255, 0, 0))
     
     # Place some blocks above the cleared rows
     test_color = (0, 255, 0)
@@ -1055,91 +1262,57 @@ def test_property_16_multiple_row_clearing(num_rows_to_clear, start_row):
         f"After clearing, no complete rows should remain, but found {complete_rows}"
 
 
-def test_is_game_over_empty_playfield():
-    """Test that is_game_over returns False for an empty playfield."""
-    playfield = Playfield()
-    
-    assert playfield.is_game_over() is False
-
-
-def test_is_game_over_blocks_not_in_top_row():
-    """Test that is_game_over returns False when blocks exist but not in top row."""
-    playfield = Playfield()
-    
-    # Place blocks in various rows except the top row
+def _place_blocks_below_top_row(playfield):
+    """Place blocks in various rows except the top row."""
     playfield.set_cell(5, 1, (255, 0, 0))
     playfield.set_cell(3, 5, (0, 255, 0))
     playfield.set_cell(7, 10, (0, 0, 255))
     playfield.set_cell(2, 19, (255, 255, 0))
-    
-    assert playfield.is_game_over() is False
 
 
-def test_is_game_over_single_block_in_top_row():
-    """Test that is_game_over returns True when a single block exists in top row."""
-    playfield = Playfield()
-    
-    # Place a single block in the top row
-    playfield.set_cell(5, 0, (255, 0, 0))
-    
-    assert playfield.is_game_over() is True
-
-
-def test_is_game_over_multiple_blocks_in_top_row():
-    """Test that is_game_over returns True when multiple blocks exist in top row."""
-    playfield = Playfield()
-    
-    # Place multiple blocks in the top row
+def _place_multiple_blocks_in_top_row(playfield):
+    """Place several separate blocks in the top row."""
     playfield.set_cell(0, 0, (255, 0, 0))
     playfield.set_cell(5, 0, (0, 255, 0))
     playfield.set_cell(9, 0, (0, 0, 255))
-    
-    assert playfield.is_game_over() is True
 
 
-def test_is_game_over_full_top_row():
-    """Test that is_game_over returns True when entire top row is filled."""
-    playfield = Playfield()
-    
-    # Fill the entire top row
-    for x in range(10):
-        playfield.set_cell(x, 0, (128, 128, 128))
+def _add_tetromino_to_top(playfield):
+    """Lock a horizontal I-piece into the top row: blocks at (0..3, 0)."""
+    from tetris.models.tetromino import Tetromino
     
-    assert playfield.is_game_over() is True
+    playfield.add_tetromino(Tetromino(shape_type='I', x=0, y=0, rotation=0))
 
 
-def test_is_game_over_after_adding_tetromino_to_top():
-    """Test that is_game_over returns True after adding a tetromino to top row."""
-    from tetris.models.tetromino import Tetromino
-    
-    playfield = Playfield()
-    
-    # Initially not game over
-    assert playfield.is_game_over() is False
-    
-    # Add a tetromino that has blocks in the top row
-    # I-piece horizontal at y=0: blocks at (0,0), (1,0), (2,0), (3,0)
-    tetromino = Tetromino(shape_type='I', x=0, y=0, rotation=0)
-    playfield.add_tetromino(tetromino)
-    
-    # Now should be game over
-    assert playfield.is_game_over() is True
+def _fill_all_rows_except_top(playfield):
+    """Fill every row except the top row."""
+    for y in range(1, 20):
+        playfield.fill_row(y, (255, 0, 0))
+
+
+def _fill_all_rows_plus_one_top_block(playfield):
+    """Fill every row except the top row, then add one block to the top row."""
+    _fill_all_rows_except_top(playfield)
+    playfield.set_cell(0, 0, (255, 0, 0))
 
 
-def test_is_game_over_playfield_almost_full():
-    """Test that is_game_over only triggers when top row has blocks."""
+@pytest.mark.parametrize("setup,expected", [
+    pytest.param(lambda playfield: None, False, id="empty_playfield"),
+    pytest.param(_place_blocks_below_top_row, False, id="blocks_not_in_top_row"),
+    pytest.param(lambda playfield: playfield.set_cell(5, 0, (255, 0, 0)), True,
+                 id="single_block_in_top_row"),
+    pytest.param(_place_multiple_blocks_in_top_row, True, id="multiple_blocks_in_top_row"),
+    pytest.param(lambda playfield: playfield.fill_row(0, (128, 128, 128)), True,
+                 id="full_top_row"),
+    pytest.param(_add_tetromino_to_top, True, id="after_adding_tetromino_to_top"),
+    pytest.param(_fill_all_rows_except_top, False, id="playfield_almost_full"),
+    pytest.param(_fill_all_rows_plus_one_top_block, True,
+                 id="playfield_almost_full_plus_top_block"),
+])
+def test_is_game_over(setup, expected):
+    """Test that is_game_over is True exactly when the top row has a block."""
     playfield = Playfield()
     
-    # Fill all rows except the top row
-    for y in range(1, 20):
-        for x in range(10):
-            playfield.set_cell(x, y, (255, 0, 0))
-    
-    # Should not be game over yet (top row is empty)
-    assert playfield.is_game_over() is False
-    
-    # Add a single block to top row
-    playfield.set_cell(0, 0, (255, 0, 0))
+    setup(playfield)
     
-    # Now should be game over
-    assert playfield.is_game_over() is True
+    assert playfield.is_game_over() is expected
@@ -4,6 +4,8 @@ This module tests tetromino shape definitions, colors, movement, and rotation.
 It includes both specific example-based tests and property-based tests using Hypothesis.
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from hypothesis import given, settings, strategies as st
 
@@ -17,50 +19,23 @@ from tetris.models.tetromino import Tetromino, TETROMINO_COLORS, TETROMINO_SHAPE
 class TestTetrominoCreation:
     """Test tetromino creation and initialization."""
     
-    def test_create_i_tetromino(self):
-        """Test creating an I-piece with correct color and attributes."""
-        tetromino = Tetromino(shape_type='I', x=5, y=10, rotation=0)
-        assert tetromino.shape_type == 'I'
-        assert tetromino.x == 5
-        assert tetromino.y == 10
+    @pytest.mark.parametrize("shape_type,x,y,color", [
+        ('I', 5, 10, (0, 255, 255)),   # Cyan
+        ('O', 3, 7, (255, 255, 0)),    # Yellow
+        ('T', 4, 2, (128, 0, 128)),    # Purple
+        ('L', 6, 8, (255, 165, 0)),    # Orange
+        ('J', 2, 5, (0, 0, 255)),      # Dark Blue
+        ('S', 7, 3, (0, 255, 0)),      # Green
+        ('Z', 1, 9, (255, 0, 0)),      # Red
+    ])
+    def test_create_tetromino(self, shape_type, x, y, color):
+        """Test creating each piece type with correct color and attributes."""
+        tetromino = Tetromino(shape_type=shape_type, x=x, y=y, rotation=0)
+        assert tetromino.shape_type == shape_type
+        assert tetromino.x == x
+        assert tetromino.y == y
         assert tetromino.rotation == 0
-        assert tetromino.color == (0, 255, 255)  # Cyan
-    
-    def test_create_o_tetromino(self):
-        """Test creating an O-piece with correct color."""
-        tetromino = Tetromino(shape_type='O', x=3, y=7, rotation=0)
-        assert tetromino.shape_type == 'O'
-        assert tetromino.color == (255, 255, 0)  # Yellow
-    
-    def test_create_t_tetromino(self):
-        """Test creating a T-piece with correct color."""
-        tetromino = Tetromino(shape_type='T', x=4, y=2, rotation=0)
-        assert tetromino.shape_type == 'T'
-        assert tetromino.color == (128, 0, 128)  # Purple
-    
-    def test_create_l_tetromino(self):
-        """Test creating an L-piece with correct color."""
-        tetromino = Tetromino(shape_type='L', x=6, y=8, rotation=0)
-        assert tetromino.shape_type == 'L'
-        assert tetromino.color == (255, 165, 0)  # Orange
-    
-    def test_create_j_tetromino(self):
-        """Test creating a J-piece with correct color."""
-        tetromino = Tetromino(shape_type='J', x=2, y=5, rotation=0)
-        assert tetromino.shape_type == 'J'
-        assert tetromino.color == (0, 0, 255)  # Dark Blue
-    
-    def test_create_s_tetromino(self):
-        """Test creating an S-piece with correct color."""
-        tetromino = Tetromino(shape_type='S', x=7, y=3, rotation=0)
-        assert tetromino.shape_type == 'S'
-        assert tetromino.color == (0, 255, 0)  # Green
-    
-    def test_create_z_tetromino(self):
-        """Test creating a Z-piece with correct color."""
-        tetromino = Tetromino(shape_type='Z', x=1, y=9, rotation=0)
-        assert tetromino.shape_type == 'Z'
-        assert tetromino.color == (255, 0, 0)  # Red
+        assert tetromino.color == color
     
     def test_invalid_shape_type_raises_error(self):
         """Test that invalid shape type raises ValueError."""
@@ -79,76 +54,42 @@ class TestTetrominoCreation:
 class TestTetrominoShapes:
     """Test that tetromino shapes have correct configurations."""
     
-    def test_i_piece_has_four_blocks(self):
-        """Test I-piece has exactly 4 blocks in horizontal configuration."""
-        tetromino = Tetromino(shape_type='I', x=0, y=0, rotation=0)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # Horizontal: [(0,0), (1,0), (2,0), (3,0)]
-        assert blocks == [(0, 0), (1, 0), (2, 0), (3, 0)]
-    
-    def test_i_piece_vertical_rotation(self):
-        """Test I-piece vertical configuration after rotation."""
-        tetromino = Tetromino(shape_type='I', x=0, y=0, rotation=1)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # Vertical: [(1,0), (1,1), (1,2), (1,3)]
-        assert blocks == [(1, 0), (1, 1), (1, 2), (1, 3)]
-    
-    def test_o_piece_is_square(self):
-        """Test O-piece is a 2x2 square."""
-        tetromino = Tetromino(shape_type='O', x=0, y=0, rotation=0)
+    @pytest.mark.parametrize("shape_type,rotation,expected", [
+        ('I', 0, ((0, 0), (1, 0), (2, 0), (3, 0))),
+        ('I', 1, ((1, 0), (1, 1), (1, 2), (1, 3))),
+        ('O', 0, ((0, 0), (1, 0), (0, 1), (1, 1))),
+        ('T', 0, ((1, 0), (0, 1), (1, 1), (2, 1))),
+        ('L', 0, ((2, 0), (0, 1), (1, 1), (2, 1))),
+        ('J', 0, ((0, 0), (0, 1), (1, 1), (2, 1))),
+        ('S', 0, ((1, 0), (2, 0), (0, 1), (1, 1))),
+        ('Z', 0, ((0, 0), (1, 0), (1, 1), (2, 1))),
+    ], ids=[
+        'I-horizontal', 'I-vertical', 'O-square', 'T-pointing-up',
+        'L-extending-right', 'J-extending-left', 'S-horizontal', 'Z-horizontal',
+    ])
+    def test_piece_shape(self, shape_type, rotation, expected):
+        """Test each piece has 4 blocks in its expected configuration."""
+        tetromino = Tetromino(shape_type=shape_type, x=0, y=0, rotation=rotation)
         blocks = tetromino.get_blocks()
         assert len(blocks) == 4
-        # Square: [(0,0), (1,0), (0,1), (1,1)]
-        assert blocks == [(0, 0), (1, 0), (0, 1), (1, 1)]
+        assert blocks == expected
     
     def test_o_piece_same_in_all_rotations(self):
         """Test O-piece looks the same in all rotation states."""
-        expected = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        expected = ((0, 0), (1, 0), (0, 1), (1, 1))
         for rotation in range(4):
             tetromino = Tetromino(shape_type='O', x=0, y=0, rotation=rotation)
             assert tetromino.get_blocks() == expected
     
-    def test_t_piece_shape(self):
-        """Test T-piece has correct T-shape configuration."""
-        tetromino = Tetromino(shape_type='T', x=0, y=0, rotation=0)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # T pointing up: [(1,0), (0,1), (1,1), (2,1)]
-        assert blocks == [(1, 0), (0, 1), (1, 1), (2, 1)]
-    
-    def test_l_piece_shape(self):
-        """Test L-piece has correct L-shape configuration."""
-        tetromino = Tetromino(shape_type='L', x=0, y=0, rotation=0)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # L with base at bottom, extending right: [(2,0), (0,1), (1,1), (2,1)]
-        assert blocks == [(2, 0), (0, 1), (1, 1), (2, 1)]
-    
-    def test_j_piece_shape(self):
-        """Test J-piece has correct J-shape configuration."""
-        tetromino = Tetromino(shape_type='J', x=0, y=0, rotation=0)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # J with base at bottom, extending left: [(0,0), (0,1), (1,1), (2,1)]
-        assert blocks == [(0, 0), (0, 1), (1, 1), (2, 1)]
-    
-    def test_s_piece_shape(self):
-        """Test S-piece has correct zigzag configuration."""
-        tetromino = Tetromino(shape_type='S', x=0, y=0, rotation=0)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # S horizontal: [(1,0), (2,0), (0,1), (1,1)]
-        assert blocks == [(1, 0), (2, 0), (0, 1), (1, 1)]
-    
-    def test_z_piece_shape(self):
-        """Test Z-piece has correct zigzag configuration."""
-        tetromino = Tetromino(shape_type='Z', x=0, y=0, rotation=0)
-        blocks = tetromino.get_blocks()
-        assert len(blocks) == 4
-        # Z horizontal: [(0,0), (1,0), (1,1), (2,1)]
-        assert blocks == [(0, 0), (1, 0), (1, 1), (2, 1)]
+    def test_get_blocks_matches_shape_definitions(self):
+        """Test get_blocks returns a shared tuple matching TETROMINO_SHAPES."""
+        for shape_type, rotations in TETROMINO_SHAPES.items():
+            for rotation, expected in enumerate(rotations):
+                blocks = Tetromino(shape_type=shape_type, x=0, y=0, rotation=rotation).get_blocks()
+                assert blocks == tuple(expected)
+                # Tetrominoes of the same shape and rotation share one tuple
+                other = Tetromino(shape_type=shape_type, x=3, y=7, rotation=rotation)
+                assert other.get_blocks() is blocks
 
 
 class TestTetrominoMovement:
@@ -250,6 +191,18 @@ class TestTetrominoRotation:
         
         assert rotated.rotation == 0
         assert rotated.get_blocks() == original_blocks
+    
+    @pytest.mark.parametrize("shape_type", ['I', 'O', 'T', 'L', 'J', 'S', 'Z'])
+    def test_four_rotations_return_to_start(self, shape_type):
+        """Test that four clockwise rotations return every rotation to itself."""
+        for rotation in range(4):
+            tetromino = Tetromino(shape_type=shape_type, x=0, y=0, rotation=rotation)
+            result = tetromino
+            for _ in range(4):
+                result = result.rotate_clockwise()
+            
+            assert result == tetromino
+            assert result.get_blocks() == tetromino.get_blocks()
 
 
 class TestAbsoluteBlocks:
@@ -271,7 +224,7 @@ class TestAbsoluteBlocks:
         
         # I-piece at rotation 0: [(0,0), (1,0), (2,0), (3,0)]
         # With offset (5, 10): [(5,10), (6,10), (7,10), (8,10)]
-        expected = [(5, 10), (6, 10), (7, 10), (8, 10)]
+        expected = ((5, 10), (6, 10), (7, 10), (8, 10))
         assert absolute == expected
     
     def test_absolute_blocks_count(self):
@@ -280,6 +233,58 @@ class TestAbsoluteBlocks:
         absolute = tetromino.get_absolute_blocks()
         
         assert len(absolute) == 4
+    
+    def test_shape_bits_decode_to_blocks(self):
+        """Test that decoding the shape mask yields the get_blocks offsets."""
+        for shape_type in TETROMINO_SHAPES:
+            for rotation in range(4):
+                tetromino = Tetromino(shape_type=shape_type, x=0, y=0, rotation=rotation)
+                bits = tetromino.get_shape_bits()
+                
+                decoded = {(bit % 4, bit // 4) for bit in range(16) if bits >> bit & 1}
+                assert decoded == set(tetromino.get_blocks())
+    
+    def test_bounds_enclose_absolute_blocks(self):
+        """Test that get_bounds is the tight bounding box of the absolute blocks."""
+        for shape_type in TETROMINO_SHAPES:
+            for rotation in range(4):
+                tetromino = Tetromino(shape_type=shape_type, x=-2, y=7, rotation=rotation)
+                blocks = tetromino.get_absolute_blocks()
+                
+                assert tetromino.get_bounds() == (
+                    min(x for x, _ in blocks),
+                    min(y for _, y in blocks),
+                    max(x for x, _ in blocks),
+                    max(y for _, y in blocks),
+                )
+    
+    def test_absolute_blocks_are_computed_once(self):
+        """Test that absolute blocks are cached and follow moves and rotations."""
+        tetromino = Tetromino(shape_type='L', x=2, y=3, rotation=0)
+        
+        assert tetromino.get_absolute_blocks() is tetromino.get_absolute_blocks()
+        assert tetromino.move(1, 2).get_absolute_blocks() == tuple(
+            (x + 1, y + 2) for x, y in tetromino.get_absolute_blocks()
+        )
+        rotated = tetromino.rotate_clockwise()
+        assert rotated.get_absolute_blocks() == tuple(
+            (2 + bx, 3 + by) for bx, by in rotated.get_blocks()
+        )
+    
+    def test_moved_and_rotated_match_constructed_tetrominoes(self):
+        """Test that move and rotate produce the same state as the constructor."""
+        for shape_type in TETROMINO_SHAPES:
+            for rotation in range(4):
+                tetromino = Tetromino(shape_type=shape_type, x=3, y=4, rotation=rotation)
+                for derived, expected in [
+                    (tetromino.move(-2, 5), Tetromino(shape_type, 1, 9, rotation)),
+                    (tetromino.rotate_clockwise(), Tetromino(shape_type, 3, 4, (rotation + 1) % 4)),
+                ]:
+                    assert derived == expected
+                    assert derived.color == expected.color
+                    assert derived.get_absolute_blocks() == expected.get_absolute_blocks()
+                    assert derived.get_shape_bits() == expected.get_shape_bits()
+                    assert derived.get_bounds() == expected.get_bounds()
 
 
 class TestTetrominoEquality:
@@ -312,42 +317,59 @@ class TestTetrominoEquality:
         t2 = Tetromino(shape_type='O', x=5, y=10, rotation=0)
         
         assert t1 != t2
+    
+    def test_equal_tetrominoes_have_equal_hashes(self):
+        """Test that equal tetrominoes hash the same and work in sets."""
+        t1 = Tetromino(shape_type='L', x=3, y=4, rotation=2)
+        t2 = Tetromino(shape_type='L', x=3, y=4, rotation=2)
+        
+        assert hash(t1) == hash(t2)
+        assert len({t1, t2, t1.move(1, 0)}) == 2
+    
+    def test_attributes_cannot_be_reassigned(self):
+        """Test that tetromino attributes are read-only."""
+        tetromino = Tetromino(shape_type='S', x=5, y=10, rotation=0)
+        
+        with pytest.raises(FrozenInstanceError):
+            tetromino.x = 6
+        assert tetromino.x == 5
+    
+    def test_repr_shows_shape_position_and_rotation(self):
+        """Test the debugging representation of a tetromino."""
+        tetromino = Tetromino(shape_type='J', x=1, y=2, rotation=3)
+        
+        assert repr(tetromino) == "Tetromino(shape_type='J', x=1, y=2, rotation=3)"
 
 
 # ============================================================================
 # Property-Based Tests
 # ============================================================================
 
-# Custom strategies for generating test data
-def tetromino_type():
-    """Strategy for generating valid tetromino types."""
-    return st.sampled_from(['I', 'O', 'T', 'L', 'J', 'S', 'Z'])
-
-
-def valid_rotation():
-    """Strategy for generating valid rotation values."""
-    return st.integers(min_value=0, max_value=3)
-
+# Custom strategies for generating test data, built once and shared by
+# every property test in this module. Properties that do not depend on the
+# position draw only the shape and rotation; TETROMINOES is for the ones
+# that do.
+SHAPE_TYPES = st.sampled_from(['I', 'O', 'T', 'L', 'J', 'S', 'Z'])
+ROTATIONS = st.integers(min_value=0, max_value=3)
+MOVE_DELTAS = st.integers(min_value=-10, max_value=10)
+TETROMINOES = st.builds(
+    Tetromino,
+    shape_type=SHAPE_TYPES,
+    x=st.integers(min_value=-5, max_value=15),
+    y=st.integers(min_value=-5, max_value=25),
+    rotation=ROTATIONS
+)
 
-def tetromino():
-    """Strategy for generating random tetrominoes."""
-    return st.builds(
-        Tetromino,
-        shape_type=tetromino_type(),
-        x=st.integers(min_value=-5, max_value=15),
-        y=st.integers(min_value=-5, max_value=25),
-        rotation=valid_rotation()
-    )
+# These properties are cheap, so skip per-example deadline timing; the
+# loaded profile (see conftest.py) decides derandomization
+FAST_SETTINGS = settings(deadline=None)
 
 
 class TestTetrominoProperties:
     """Property-based tests for tetromino invariants."""
     
-    @settings(max_examples=100)
-    @given(
-        shape_type=tetromino_type(),
-        rotation=valid_rotation()
-    )
+    @FAST_SETTINGS
+    @given(shape_type=SHAPE_TYPES, rotation=ROTATIONS)
     def test_property_4_tetromino_block_count_invariant(self, shape_type, rotation):
         """Property 4: Any tetromino always has exactly 4 blocks.
         
@@ -362,14 +384,15 @@ class TestTetrominoProperties:
             f"expected 4"
         )
     
-    @settings(max_examples=100)
-    @given(tetromino=tetromino())
-    def test_property_6_rotation_preserves_block_count(self, tetromino):
+    @FAST_SETTINGS
+    @given(shape_type=SHAPE_TYPES, rotation=ROTATIONS)
+    def test_property_6_rotation_preserves_block_count(self, shape_type, rotation):
         """Property 6: Rotating clockwise preserves block count and color.
         
         Feature: tetris-clone, Property 6: Rotation Preserves Block Count
         Validates: Requirements 3.3
         """
+        tetromino = Tetromino(shape_type=shape_type, x=0, y=0, rotation=rotation)
         rotated = tetromino.rotate_clockwise()
         
         # Check block count preserved
@@ -386,8 +409,8 @@ class TestTetrominoProperties:
         # Check shape type preserved
         assert rotated.shape_type == tetromino.shape_type
     
-    @settings(max_examples=100)
-    @given(tetromino=tetromino())
+    @FAST_SETTINGS
+    @given(tetromino=TETROMINOES)
     def test_property_10_rotation_center_preservation(self, tetromino):
         """Property 10: Rotation preserves center position.
         
@@ -403,12 +426,8 @@ class TestTetrominoProperties:
             f"Rotation changed y from {tetromino.y} to {rotated.y}"
         )
     
-    @settings(max_examples=100)
-    @given(
-        tetromino=tetromino(),
-        dx=st.integers(min_value=-10, max_value=10),
-        dy=st.integers(min_value=-10, max_value=10)
-    )
+    @FAST_SETTINGS
+    @given(tetromino=TETROMINOES, dx=MOVE_DELTAS, dy=MOVE_DELTAS)
     def test_property_5_movement_delta_correctness(self, tetromino, dx, dy):
         """Property 5: Movement delta is applied correctly.
         
@@ -429,8 +448,8 @@ class TestTetrominoProperties:
         assert moved.rotation == tetromino.rotation
         assert moved.color == tetromino.color
     
-    @settings(max_examples=100)
-    @given(tetromino=tetromino())
+    @FAST_SETTINGS
+    @given(tetromino=TETROMINOES)
     def test_immutability_move(self, tetromino):
         """Test that move operation doesn't modify original tetromino."""
         original_x = tetromino.x
@@ -445,10 +464,11 @@ class TestTetrominoProperties:
         # New instance created
         assert moved is not tetromino
     
-    @settings(max_examples=100)
-    @given(tetromino=tetromino())
-    def test_immutability_rotate(self, tetromino):
+    @FAST_SETTINGS
+    @given(shape_type=SHAPE_TYPES, rotation=ROTATIONS)
+    def test_immutability_rotate(self, shape_type, rotation):
         """Test that rotate operation doesn't modify original tetromino."""
+        tetromino = Tetromino(shape_type=shape_type, x=0, y=0, rotation=rotation)
         original_rotation = tetromino.rotation
         
         rotated = tetromino.rotate_clockwise()
@@ -458,14 +478,3 @@ class TestTetrominoProperties:
         
         # New instance created
         assert rotated is not tetromino
-    
-    @settings(max_examples=100)
-    @given(tetromino=tetromino())
-    def test_four_rotations_return_to_start(self, tetromino):
-        """Test that four clockwise rotations return to original state."""
-        result = tetromino
-        for _ in range(4):
-            result = result.rotate_clockwise()
-        
-        assert result.rotation == tetromino.rotation
-        assert result.get_blocks() == tetromino.get_blocks()
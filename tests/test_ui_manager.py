@@ -11,9 +11,9 @@ from tetris.views.ui_screens import UIManager, Screen
 from tetris.models.high_scores import HighScoreEntry
 
 
-@pytest.fixture
-def mock_screen():
-    """Provide a mock Pygame surface for testing."""
+@pytest.fixture(scope="module")
+def shared_screen():
+    """Provide a mock Pygame surface (shared by the module)."""
     screen = MagicMock()
     screen.fill = Mock()
     screen.blit = Mock()
@@ -21,13 +21,30 @@ def mock_screen():
 
 
 @pytest.fixture
-def ui_manager(mock_screen):
-    """Provide a UIManager instance with mock screen."""
+def mock_screen(shared_screen):
+    """Provide the shared mock surface with its recorded calls cleared."""
+    shared_screen.reset_mock()
+    return shared_screen
+
+
+@pytest.fixture(scope="module")
+def shared_ui_manager(shared_screen):
+    """Provide a UIManager built once for the module, so fonts load once."""
     # Ensure pygame is initialized (may have been quit by other tests)
     if not pygame.get_init():
         pygame.init()
     pygame.font.init()
-    return UIManager(screen=mock_screen)
+    return UIManager(screen=shared_screen)
+
+
+@pytest.fixture
+def ui_manager(shared_ui_manager, mock_screen):
+    """Provide the shared UIManager reset to its initial state."""
+    shared_ui_manager.screen = mock_screen
+    shared_ui_manager.current_screen = Screen.START
+    shared_ui_manager.player_name = ""
+    shared_ui_manager._text_cache.clear()
+    return shared_ui_manager
 
 
 def test_ui_manager_initializes_with_start_screen(ui_manager):
@@ -133,8 +150,11 @@ def test_handle_name_entry_input_adds_multiple_characters(ui_manager):
         ('E', 101),  # K_e
     ]
     
+    # One event object is reused for every keystroke
+    event = SimpleNamespace(type=768, key=0, unicode='')  # 768 = KEYDOWN
     for char, key in events:
-        event = SimpleNamespace(type=768, key=key, unicode=char)  # 768 = KEYDOWN
+        event.key = key
+        event.unicode = char
         ui_manager.handle_name_entry_input(event)
     
     assert ui_manager.player_name == "ALICE"
@@ -198,6 +218,30 @@ def test_handle_name_entry_input_ignores_non_printable_characters(ui_manager):
     assert ui_manager.player_name == "ALICE"
 
 
+def test_handle_name_entry_input_accepts_punctuation(ui_manager):
+    """Test that printable ASCII punctuation is added to the name."""
+    ui_manager.player_name = "ALICE"
+    
+    from types import SimpleNamespace
+    event = SimpleNamespace(type=768, key=45, unicode='-')  # 768 = KEYDOWN, 45 = K_MINUS
+    
+    ui_manager.handle_name_entry_input(event)
+    assert ui_manager.player_name == "ALICE-"
+
+
+def test_handle_name_entry_input_ignores_non_ascii_and_empty_input(ui_manager):
+    """Test that characters outside printable ASCII and empty input are ignored."""
+    ui_manager.player_name = "ALICE"
+    
+    from types import SimpleNamespace
+    event = SimpleNamespace(type=768, key=0, unicode='')  # 768 = KEYDOWN
+    for char in ['\u00e9', '', '\x00']:
+        event.unicode = char
+        ui_manager.handle_name_entry_input(event)
+    
+    assert ui_manager.player_name == "ALICE"
+
+
 def test_complete_screen_flow(ui_manager):
     """Test complete screen flow from start through name entry back to start."""
     # Start at START screen
@@ -251,3 +295,20 @@ def test_draw_text_with_center_alignment(ui_manager, mock_screen):
     # This is a basic smoke test - just verify it doesn't crash
     ui_manager.draw_text("Test", ui_manager.text_font, (255, 255, 255), 400, 300, center=True)
     assert mock_screen.blit.called
+
+
+def test_draw_text_reuses_rendered_surface(ui_manager, mock_screen):
+    """Test that drawing the same text twice only renders it once."""
+    font = MagicMock()
+    ui_manager.draw_text("Test", font, (255, 255, 255), 100, 100)
+    ui_manager.draw_text("Test", font, (255, 255, 255), 200, 200)
+    font.render.assert_called_once_with("Test", True, (255, 255, 255))
+    assert mock_screen.blit.call_count == 2
+
+
+def test_draw_text_renders_again_for_different_color(ui_manager, mock_screen):
+    """Test that the same text in another color is rendered separately."""
+    font = MagicMock()
+    ui_manager.draw_text("Test", font, (255, 255, 255), 100, 100)
+    ui_manager.draw_text("Test", font, (255, 255, 0), 100, 100)
+    assert font.render.call_count == 2
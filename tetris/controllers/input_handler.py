@@ -5,13 +5,22 @@ and translates them into game actions. The input handler is a thin routing
 layer that doesn't contain business logic.
 """
 
-from typing import TYPE_CHECKING
+from operator import methodcaller
+from typing import TYPE_CHECKING, Callable, Dict
 
 import pygame
 
+from tetris.views.ui_screens import Screen
+
 if TYPE_CHECKING:
     from tetris.models.game_state import GameState
-    from tetris.views.ui_screens import UIManager, Screen
+    from tetris.views.ui_screens import UIManager
+
+
+# Event constants checked on every event, bound once at import time
+_KEYDOWN = pygame.KEYDOWN
+_K_SPACE = pygame.K_SPACE
+_SUBMIT_KEYS = frozenset((pygame.K_RETURN, pygame.K_KP_ENTER))
 
 
 class InputHandler:
@@ -25,11 +34,27 @@ class InputHandler:
     - Game input: Controls during active gameplay (move, rotate, drop)
     - Menu input: Navigation in menu screens (start game, view scores)
     - Text input: Character entry for player names
+    
+    Key and screen routing is done with dispatch tables built once at
+    construction instead of comparison chains per event.
     """
     
     def __init__(self) -> None:
-        """Initialize the input handler."""
-        pass
+        """Initialize the input handler and its dispatch tables."""
+        # Gameplay keys -> game state action
+        self._game_actions: Dict[int, Callable[['GameState'], object]] = {
+            pygame.K_LEFT: methodcaller('move_active_left'),
+            pygame.K_RIGHT: methodcaller('move_active_right'),
+            pygame.K_SPACE: methodcaller('rotate_active'),
+            pygame.K_DOWN: methodcaller('hard_drop'),
+        }
+        
+        # Menu screens -> action for SPACE
+        self._menu_actions: Dict[Screen, Callable[['UIManager', 'GameState'], None]] = {
+            Screen.START: self._start_game,
+            Screen.GAME_OVER: self._return_to_start,
+            Screen.HIGH_SCORES: self._return_to_start,
+        }
     
     def handle_game_input(self, event: pygame.event.Event,
                          game_state: 'GameState') -> None:
@@ -45,17 +70,12 @@ class InputHandler:
             event: Pygame keyboard event (must be KEYDOWN type)
             game_state: The GameState instance to control
         """
-        if event.type != pygame.KEYDOWN:
+        if event.type != _KEYDOWN:
             return
         
-        if event.key == pygame.K_LEFT:
-            game_state.move_active_left()
-        elif event.key == pygame.K_RIGHT:
-            game_state.move_active_right()
-        elif event.key == pygame.K_SPACE:
-            game_state.rotate_active()
-        elif event.key == pygame.K_DOWN:
-            game_state.hard_drop()
+        action = self._game_actions.get(event.key)
+        if action is not None:
+            action(game_state)
     
     def handle_menu_input(self, event: pygame.event.Event,
                          ui_manager: 'UIManager',
@@ -72,26 +92,24 @@ class InputHandler:
             ui_manager: The UIManager instance to control screen transitions
             game_state: The GameState instance (for starting new games)
         """
-        if event.type != pygame.KEYDOWN:
+        if event.type != _KEYDOWN or event.key != _K_SPACE:
             return
         
-        # Import Screen enum here to avoid circular imports
-        from tetris.views.ui_screens import Screen
-        
-        if event.key == pygame.K_SPACE:
-            if ui_manager.current_screen == Screen.START:
-                # Start a new game
-                game_state.reset()
-                game_state.spawn_tetromino()
-                ui_manager.transition_to(Screen.GAME)
-            
-            elif ui_manager.current_screen == Screen.GAME_OVER:
-                # Continue to start screen
-                ui_manager.transition_to(Screen.START)
-            
-            elif ui_manager.current_screen == Screen.HIGH_SCORES:
-                # Return to start screen
-                ui_manager.transition_to(Screen.START)
+        action = self._menu_actions.get(ui_manager.current_screen)
+        if action is not None:
+            action(ui_manager, game_state)
+    
+    def _start_game(self, ui_manager: 'UIManager',
+                    game_state: 'GameState') -> None:
+        """Start a new game from the START screen."""
+        game_state.reset()
+        game_state.spawn_tetromino()
+        ui_manager.transition_to(Screen.GAME)
+    
+    def _return_to_start(self, ui_manager: 'UIManager',
+                         game_state: 'GameState') -> None:
+        """Return to the START screen from GAME_OVER or HIGH_SCORES."""
+        ui_manager.transition_to(Screen.START)
     
     def handle_text_input(self, event: pygame.event.Event,
                          ui_manager: 'UIManager') -> bool:
@@ -110,17 +128,14 @@ class InputHandler:
         Returns:
             True if ENTER was pressed (name submitted), False otherwise
         """
-        if event.type != pygame.KEYDOWN:
+        if event.type != _KEYDOWN:
             return False
         
         # Let UIManager handle the character input
         ui_manager.handle_name_entry_input(event)
         
         # Check if ENTER was pressed to submit
-        if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
-            return True
-        
-        return False
+        return event.key in _SUBMIT_KEYS
     
     def handle_event(self, event: pygame.event.Event,
                     game_state: 'GameState',
@@ -140,9 +155,6 @@ class InputHandler:
             True if the event was a name submission (ENTER in NAME_ENTRY screen),
             False otherwise
         """
-        # Import Screen enum here to avoid circular imports
-        from tetris.views.ui_screens import Screen
-        
         if ui_manager.current_screen == Screen.GAME:
             # During gameplay, handle game input
             if not game_state.game_over:
@@ -18,6 +18,24 @@ from tetris.models.high_scores import HighScoreManager
 from tetris.views.renderer import Renderer, SCREEN_WIDTH, SCREEN_HEIGHT
 from tetris.views.ui_screens import UIManager, Screen
 
+# Frame rate targets: the game screen animates, menu screens only react to input
+GAME_FPS = 60
+MENU_FPS = 30
+
+# The game is simulated in fixed steps, independent of the frame rate. Long
+# frames (e.g. the window being dragged) are capped so the simulation does
+# not try to catch up with a burst of steps.
+FIXED_DT = 1.0 / 60.0
+MAX_FRAME_TIME = 0.25
+
+# How long an idle menu screen blocks waiting for input (milliseconds)
+IDLE_WAIT_MS = 500
+
+# Events the main loop reacts to. Everything else (mouse motion, focus,
+# joystick, ...) is dropped by SDL before it reaches the Python event queue;
+# expose events are kept so static screens are redrawn when uncovered.
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+
 
 def main() -> int:
     """Initialize and run the Tetris game.
@@ -37,6 +55,8 @@ def main() -> int:
     try:
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("TETRIS")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
     except pygame.error as e:
         print(f"Failed to create display: {e}", file=sys.stderr)
         pygame.quit()
@@ -55,90 +75,166 @@ def main() -> int:
     # Game over overlay state
     game_over_overlay_timer = 0.0
     game_over_overlay_duration = 2.0  # Show overlay for 2 seconds
-    showing_game_over_overlay = False
+    
+    # Frame time not yet consumed by fixed simulation steps
+    simulation_time = 0.0
+    
+    # Per-screen event, update and render handlers, looked up once per phase
+    # instead of walking a chain of screen comparisons
+    def ignore_event(event: pygame.event.Event) -> None:
+        # Skip input during game over overlay
+        pass
+    
+    def handle_game_event(event: pygame.event.Event) -> None:
+        # During gameplay, handle game input
+        if not game_state.game_over:
+            input_handler.handle_game_input(event, game_state)
+    
+    def handle_name_entry_event(event: pygame.event.Event) -> None:
+        # During name entry, handle text input
+        if input_handler.handle_text_input(event, ui_manager):
+            # ENTER was pressed - submit the name
+            if ui_manager.player_name.strip():  # Only if name is not empty
+                high_score_manager.add_score(
+                    ui_manager.player_name.strip(),
+                    game_state.score
+                )
+                high_score_manager.save()
+            # Go back to start screen (which shows high scores)
+            ui_manager.transition_to(Screen.START)
+    
+    def handle_menu_event(event: pygame.event.Event) -> None:
+        # In menu screens, handle menu input
+        input_handler.handle_menu_input(event, ui_manager, game_state)
+    
+    def update_game(delta_time: float) -> bool:
+        nonlocal game_over_overlay_timer, simulation_time
+        
+        # Every visible change moves the piece or, when it locks, adds to
+        # the score, so these two tell whether the board needs redrawing
+        shown = (game_state.active_tetromino, game_state.score)
+        
+        simulation_time += min(delta_time, MAX_FRAME_TIME)
+        while simulation_time >= FIXED_DT and not game_state.game_over:
+            game_state.update(FIXED_DT)
+            simulation_time -= FIXED_DT
+        
+        # Check for game over transition
+        if game_state.game_over:
+            # Game just ended - start showing overlay
+            game_over_overlay_timer = 0.0
+            simulation_time = 0.0
+            ui_manager.transition_to(Screen.GAME_OVER_OVERLAY)
+            return True
+        
+        return (game_state.active_tetromino, game_state.score) != shown
+    
+    def update_game_over_overlay(delta_time: float) -> bool:
+        nonlocal game_over_overlay_timer
+        
+        game_over_overlay_timer += delta_time
+        if game_over_overlay_timer < game_over_overlay_duration:
+            # The overlay is static until it times out
+            return False
+        
+        # Overlay time is up - transition to next screen
+        game_over_overlay_timer = 0.0
+        if high_score_manager.is_high_score(game_state.score):
+            ui_manager.transition_to(Screen.NAME_ENTRY)
+        else:
+            ui_manager.transition_to(Screen.GAME_OVER)
+        return True
+    
+    def render_start() -> None:
+        ui_manager.render_start_screen(high_score_manager.get_top_scores())
+    
+    def render_game() -> None:
+        renderer.render_game(game_state)
+    
+    def render_game_over_overlay() -> None:
+        renderer.render_game(game_state)
+        ui_manager.render_game_over_overlay(game_state.score)
+    
+    def render_game_over() -> None:
+        ui_manager.render_game_over_screen(game_state.score)
+    
+    def render_name_entry() -> None:
+        ui_manager.render_name_entry_screen(game_state.score)
+    
+    event_handlers = {
+        Screen.START: handle_menu_event,
+        Screen.GAME: handle_game_event,
+        Screen.GAME_OVER_OVERLAY: ignore_event,
+        Screen.NAME_ENTRY: handle_name_entry_event,
+        Screen.GAME_OVER: handle_menu_event,
+        Screen.HIGH_SCORES: handle_menu_event,
+    }
+    
+    # Menu screens have nothing to update between events
+    update_handlers = {
+        Screen.GAME: update_game,
+        Screen.GAME_OVER_OVERLAY: update_game_over_overlay,
+    }
+    
+    # Note: HIGH_SCORES screen is not used - start screen shows high scores instead
+    render_handlers = {
+        Screen.START: render_start,
+        Screen.GAME: render_game,
+        Screen.GAME_OVER_OVERLAY: render_game_over_overlay,
+        Screen.GAME_OVER: render_game_over,
+        Screen.NAME_ENTRY: render_name_entry,
+    }
+    
+    # The screen is only redrawn when an event arrived, the game state
+    # visibly changed or the screen changed
+    needs_redraw = True
     
     # Main game loop
     running = True
     while running:
-        # 1. Calculate delta time (convert milliseconds to seconds)
-        delta_time = clock.tick(60) / 1000.0  # 60 FPS
-        
-        # 2. Handle game over overlay timer
-        if showing_game_over_overlay:
-            game_over_overlay_timer += delta_time
-            if game_over_overlay_timer >= game_over_overlay_duration:
-                # Overlay time is up - transition to next screen
-                showing_game_over_overlay = False
-                game_over_overlay_timer = 0.0
-                
-                if high_score_manager.is_high_score(game_state.score):
-                    ui_manager.transition_to(Screen.NAME_ENTRY)
-                else:
-                    ui_manager.transition_to(Screen.GAME_OVER)
+        # 1. Wait for the next frame and collect its events
+        current_screen = ui_manager.current_screen
+        if current_screen not in update_handlers and not needs_redraw:
+            # Nothing to update or redraw - sleep until input arrives
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            
+            # Time spent idle does not count as frame time
+            clock.tick()
+            delta_time = 0.0
+        else:
+            # Calculate delta time (convert milliseconds to seconds)
+            target_fps = GAME_FPS if current_screen is Screen.GAME else MENU_FPS
+            delta_time = clock.tick(target_fps) / 1000.0
+            events = pygame.event.get()
         
-        # 3. Handle events
-        for event in pygame.event.get():
+        # 2. Handle events
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 break
             
-            # Skip input during game over overlay
-            if showing_game_over_overlay:
-                continue
+            # Any event may change what is shown (input, window exposure)
+            needs_redraw = True
             
             # Route events based on current screen
-            if ui_manager.current_screen == Screen.GAME:
-                # During gameplay, handle game input
-                if not game_state.game_over:
-                    input_handler.handle_game_input(event, game_state)
-            
-            elif ui_manager.current_screen == Screen.NAME_ENTRY:
-                # During name entry, handle text input
-                if input_handler.handle_text_input(event, ui_manager):
-                    # ENTER was pressed - submit the name
-                    if ui_manager.player_name.strip():  # Only if name is not empty
-                        high_score_manager.add_score(
-                            ui_manager.player_name.strip(),
-                            game_state.score
-                        )
-                        high_score_manager.save()
-                    # Go back to start screen (which shows high scores)
-                    ui_manager.transition_to(Screen.START)
-            
-            else:
-                # In menu screens, handle menu input
-                input_handler.handle_menu_input(event, ui_manager, game_state)
-        
-        # 4. Update game state (only during active gameplay)
-        if ui_manager.current_screen == Screen.GAME and not game_state.game_over:
-            game_state.update(delta_time)
-        
-        # 5. Check for game over transition
-        if ui_manager.current_screen == Screen.GAME and game_state.game_over and not showing_game_over_overlay:
-            # Game just ended - start showing overlay
-            showing_game_over_overlay = True
-            game_over_overlay_timer = 0.0
+            event_handlers[ui_manager.current_screen](event)
         
-        # 6. Render current screen
-        if ui_manager.current_screen == Screen.START:
-            ui_manager.render_start_screen(high_score_manager.get_top_scores())
+        # 3. Update game state and the game over overlay timer (the update
+        #    handlers report whether the screen changed)
+        update = update_handlers.get(ui_manager.current_screen)
+        if update is not None and update(delta_time):
+            needs_redraw = True
         
-        elif ui_manager.current_screen == Screen.GAME:
-            renderer.render_game(game_state)
-            # Show game over overlay if active
-            if showing_game_over_overlay:
-                ui_manager.render_game_over_overlay(game_state.score)
-        
-        elif ui_manager.current_screen == Screen.GAME_OVER:
-            ui_manager.render_game_over_screen(game_state.score)
-        
-        elif ui_manager.current_screen == Screen.NAME_ENTRY:
-            ui_manager.render_name_entry_screen(game_state.score)
-        
-        # Note: HIGH_SCORES screen is not used - start screen shows high scores instead
-        
-        # 7. Update display
-        pygame.display.flip()
+        # 4. Render current screen and update display (only if it changed)
+        if needs_redraw:
+            render = render_handlers.get(ui_manager.current_screen)
+            if render is not None:
+                render()
+            
+            pygame.display.flip()
+            needs_redraw = False
     
     # Cleanup
     pygame.quit()
@@ -6,7 +6,8 @@ state, and automatic falling mechanics.
 """
 
 import random
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
 from tetris.models.playfield import Playfield
 from tetris.models.tetromino import Tetromino
@@ -15,6 +16,9 @@ from tetris.models.tetromino import Tetromino
 # Game timing constants
 DEFAULT_FALL_INTERVAL = 0.5  # Seconds between automatic falls
 
+# The seven tetromino types, shuffled into each new bag of spawns
+_SHAPE_TYPES = ('I', 'O', 'T', 'L', 'J', 'S', 'Z')
+
 
 class GameState:
     """Central game state manager coordinating all game logic and rules.
@@ -33,6 +37,7 @@ class GameState:
         game_over: Whether the game has ended
         fall_timer: Time accumulator for automatic falling (seconds)
         fall_interval: Time between automatic falls (seconds)
+        _bag: Shape types still to be spawned from the current shuffled bag
     """
     
     def __init__(self) -> None:
@@ -50,6 +55,9 @@ class GameState:
         # Fall timing
         self.fall_timer = 0.0
         self.fall_interval = DEFAULT_FALL_INTERVAL
+        
+        # Upcoming shape types ("7-bag"), refilled when empty
+        self._bag: Deque[str] = deque()
     
     def reset(self) -> None:
         """Reset the game state to start a new game.
@@ -64,19 +72,24 @@ class GameState:
             - Clears game_over flag
             - Clears active_tetromino
             - Resets fall_timer
+            - Starts a new bag of shape types
         """
         self.playfield = Playfield()
         self.active_tetromino = None
         self.score = 0
         self.game_over = False
         self.fall_timer = 0.0
+        self._bag.clear()
     
     def spawn_tetromino(self) -> Optional[Tetromino]:
         """Spawn a new random tetromino at the top center of the playfield.
         
-        Randomly selects one of the seven tetromino types and creates it
-        at position (x=4, y=0) with rotation 0. If the spawn position is
-        already occupied (collision), triggers game over.
+        Takes the next tetromino type from a shuffled bag of all seven
+        types ("7-bag") and creates it at position (x=4, y=0) with rotation
+        0. When the bag is empty it is refilled in a new random order, so
+        every seven consecutive spawns contain each type exactly once. If
+        the spawn position is already occupied (collision), triggers game
+        over.
         
         Returns:
             The newly spawned tetromino, or None if game over
@@ -89,9 +102,12 @@ class GameState:
         if self.game_over:
             return None
         
-        # Randomly select a tetromino type
-        shape_types = ['I', 'O', 'T', 'L', 'J', 'S', 'Z']
-        shape_type = random.choice(shape_types)
+        # Take the next type from the bag, refilling it in random order
+        if not self._bag:
+            bag = list(_SHAPE_TYPES)
+            random.shuffle(bag)
+            self._bag.extend(bag)
+        shape_type = self._bag.popleft()
         
         # Create tetromino at top center (x=4, y=0)
         new_tetromino = Tetromino(shape_type=shape_type, x=4, y=0, rotation=0)
@@ -118,12 +134,9 @@ class GameState:
         if self.active_tetromino is None or self.game_over:
             return False
         
-        # Try moving left
-        moved = self.active_tetromino.move(-1, 0)
-        
-        # Check if the new position is valid
-        if self.playfield.is_valid_position(moved):
-            self.active_tetromino = moved
+        # Check the new position before creating the moved tetromino
+        if self.playfield.is_valid_position(self.active_tetromino, -1, 0):
+            self.active_tetromino = self.active_tetromino.move(-1, 0)
             return True
         
         return False
@@ -140,12 +153,9 @@ class GameState:
         if self.active_tetromino is None or self.game_over:
             return False
         
-        # Try moving right
-        moved = self.active_tetromino.move(1, 0)
-        
-        # Check if the new position is valid
-        if self.playfield.is_valid_position(moved):
-            self.active_tetromino = moved
+        # Check the new position before creating the moved tetromino
+        if self.playfield.is_valid_position(self.active_tetromino, 1, 0):
+            self.active_tetromino = self.active_tetromino.move(1, 0)
             return True
         
         return False
@@ -185,14 +195,10 @@ class GameState:
         if self.active_tetromino is None or self.game_over:
             return
         
-        # Move down until collision
-        while True:
-            moved = self.active_tetromino.move(0, 1)
-            if self.playfield.is_valid_position(moved):
-                self.active_tetromino = moved
-            else:
-                # Can't move down further - lock it
-                break
+        # Move down as far as possible before collision
+        distance = self.playfield.drop_distance(self.active_tetromino)
+        if distance:
+            self.active_tetromino = self.active_tetromino.move(0, distance)
         
         # Lock the tetromino at its final position
         self.lock_tetromino()
@@ -223,14 +229,8 @@ class GameState:
         # Award points for locking (4 points)
         self.score += 4
         
-        # Check for complete rows
-        complete_rows = self.playfield.get_complete_rows()
-        
-        # Clear complete rows and award bonus points
-        if complete_rows:
-            self.playfield.clear_rows(complete_rows)
-            # Award 10 points per cleared row
-            self.score += len(complete_rows) * 10
+        # Clear complete rows and award 10 bonus points per cleared row
+        self.score += self.playfield.clear_complete_rows() * 10
         
         # Check for game over (blocks in top row)
         if self.playfield.is_game_over():
@@ -268,11 +268,9 @@ class GameState:
             self.fall_timer = 0.0
             
             # Try to move down
-            moved = self.active_tetromino.move(0, 1)
-            
-            if self.playfield.is_valid_position(moved):
+            if self.playfield.is_valid_position(self.active_tetromino, 0, 1):
                 # Move down successful
-                self.active_tetromino = moved
+                self.active_tetromino = self.active_tetromino.move(0, 1)
             else:
                 # Can't move down - lock the tetromino
                 self.lock_tetromino()
@@ -290,5 +288,4 @@ class GameState:
         Returns:
             True if the move is valid, False otherwise
         """
-        moved = tetromino.move(dx, dy)
-        return self.playfield.is_valid_position(moved)
+        return self.playfield.is_valid_position(tetromino, dx, dy)
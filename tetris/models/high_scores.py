@@ -6,9 +6,11 @@ names and timestamps.
 """
 
 import json
-from dataclasses import dataclass, asdict
+import os
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import List
 
 
 @dataclass
@@ -34,6 +36,11 @@ class HighScoreEntry:
             raise ValueError("Timestamp must be a string")
 
 
+def _descending_score(entry: HighScoreEntry) -> int:
+    """Sort key that orders entries by score, highest first."""
+    return -entry.score
+
+
 class HighScoreManager:
     """Manages high score persistence and ranking.
     
@@ -63,11 +70,18 @@ class HighScoreManager:
         
         If the file doesn't exist, initializes with an empty list.
         If the file is corrupted, logs a warning and initializes with an empty list.
+        The loaded entries are sorted by score descending (keeping the file
+        order for equal scores) and cut to the top 10, so a hand-edited file
+        cannot break the ordering add_score relies on.
         """
         try:
             with open(self.file_path, 'r') as f:
                 data = json.load(f)
-                self.scores = [HighScoreEntry(**entry) for entry in data]
+                self.scores = sorted(
+                    (HighScoreEntry(**entry) for entry in data),
+                    key=_descending_score
+                )
+                del self.scores[self.MAX_SCORES:]
         except FileNotFoundError:
             # First run - no high scores yet
             self.scores = []
@@ -79,16 +93,27 @@ class HighScoreManager:
     def save(self) -> None:
         """Save high scores to the JSON file.
         
-        Writes the current scores list to the JSON file. If unable to write,
-        logs an error but allows the program to continue.
+        Writes the current scores list to the JSON file. The data is written
+        to a temporary file next to it first, which then replaces the real
+        file, so an interrupted save never leaves a half-written file
+        behind. If unable to write, logs an error but allows the program to
+        continue.
         """
+        temp_path = self.file_path + '.tmp'
         try:
-            with open(self.file_path, 'w') as f:
-                data = [asdict(entry) for entry in self.scores]
+            with open(temp_path, 'w') as f:
+                # Flat entries - build the dicts directly instead of via asdict()
+                data = [
+                    {'name': entry.name, 'score': entry.score, 'timestamp': entry.timestamp}
+                    for entry in self.scores
+                ]
                 json.dump(data, f, indent=2)
+            os.replace(temp_path, self.file_path)
         except (IOError, OSError) as e:
             # Write permission error - log but continue
             print(f"Error: Unable to save high scores: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
     
     def is_high_score(self, score: int) -> bool:
         """Check if a score qualifies for the top 10.
@@ -108,6 +133,9 @@ class HighScoreManager:
         
         Adds the score if it qualifies for the top 10, maintains the list
         sorted in descending order, and ensures the list never exceeds 10 entries.
+        The entry is inserted at its rank with a binary search (after any
+        entries with the same score) instead of re-sorting the list; load
+        keeps the list sorted for this.
         
         Args:
             name: Player name
@@ -120,12 +148,12 @@ class HighScoreManager:
         timestamp = datetime.now().isoformat()
         entry = HighScoreEntry(name=name, score=score, timestamp=timestamp)
         
-        # Add to list and sort
-        self.scores.append(entry)
-        self.scores.sort(key=lambda e: e.score, reverse=True)
+        # Insert at its rank in the sorted list
+        index = bisect_right(self.scores, -score, key=_descending_score)
+        self.scores.insert(index, entry)
         
         # Keep only top 10
-        self.scores = self.scores[:self.MAX_SCORES]
+        del self.scores[self.MAX_SCORES:]
     
     def get_top_scores(self, n: int = MAX_SCORES) -> List[HighScoreEntry]:
         """Get the top N high scores.
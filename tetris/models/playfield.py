@@ -6,7 +6,7 @@ of each cell (empty or occupied with a color) and provides methods for
 querying and modifying the grid state.
 """
 
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tetris.models.tetromino import Tetromino
@@ -15,6 +15,34 @@ if TYPE_CHECKING:
 PLAYFIELD_WIDTH = 10
 PLAYFIELD_HEIGHT = 20
 
+# Row bitmap of a completely filled row
+_FULL_ROW_BITS = (1 << PLAYFIELD_WIDTH) - 1
+
+# Interned colors: cells store a small integer id per color instead of the
+# RGB tuple itself, with id 0 reserved for an empty cell. The game only ever
+# uses a handful of distinct colors, so the tables stay tiny.
+_COLOR_IDS: Dict[Tuple[int, int, int], int] = {}
+_COLORS_BY_ID: List[Optional[Tuple[int, int, int]]] = [None]
+
+
+def _intern_color(color: Optional[Tuple[int, int, int]]) -> int:
+    """Return the interned id for a color, assigning a new one if needed.
+    
+    Args:
+        color: RGB color tuple, or None for an empty cell
+    
+    Returns:
+        0 for None, otherwise a stable positive id for the color
+    """
+    if color is None:
+        return 0
+    color_id = _COLOR_IDS.get(color)
+    if color_id is None:
+        color_id = len(_COLORS_BY_ID)
+        _COLOR_IDS[color] = color_id
+        _COLORS_BY_ID.append(color)
+    return color_id
+
 
 class Playfield:
     """Manages the 10×20 grid state for the Tetris game.
@@ -26,17 +54,30 @@ class Playfield:
     Attributes:
         width: Number of columns in the playfield (always 10)
         height: Number of rows in the playfield (always 20)
-        grid: 2D list representing the playfield state, where each cell
-              is either None (empty) or an RGB color tuple (occupied)
+        cells: Flat row-major list of width * height interned color ids,
+              where the cell at (x, y) is stored at index y * width + x and
+              is 0 (empty) or the id of its RGB color (occupied); use
+              get_cell to read the color tuple
+        filled_count: Number of occupied cells in each row, maintained
+              incrementally by every mutator
+        row_bits: Occupancy bitmap of each row, with bit x set if the cell
+              at (x, y) is occupied. Collision and occupancy checks read
+              this instead of the color ids in cells.
     """
     
     def __init__(self) -> None:
         """Initialize a new empty playfield with 10×20 grid."""
         self.width = PLAYFIELD_WIDTH
         self.height = PLAYFIELD_HEIGHT
-        # Initialize grid as 20 rows × 10 columns with None values
-        # grid[y][x] where y is row (0=top, 19=bottom) and x is column (0=left, 9=right)
-        self.grid = [[None for _ in range(self.width)] for _ in range(self.height)]
+        # Initialize 20 rows × 10 columns of empty cells in a single list;
+        # y is the row (0=top, 19=bottom) and x the column (0=left, 9=right)
+        self.cells = [0] * (self.width * self.height)
+        self.filled_count = [0] * self.height
+        self.row_bits = [0] * self.height
+        # Rows whose filled_count equals the width, kept in sync with it
+        self._complete: Set[int] = set()
+        # Cells changed since the renderer last took them (see take_dirty_cells)
+        self._dirty: Set[Tuple[int, int]] = set()
     
     def get_cell(self, x: int, y: int) -> Optional[Tuple[int, int, int]]:
         """Get the color value at the specified grid position.
@@ -56,7 +97,7 @@ class Playfield:
         if not (0 <= y < self.height):
             raise IndexError(f"Row index {y} out of bounds (0-{self.height-1})")
         
-        return self.grid[y][x]
+        return _COLORS_BY_ID[self.cells[y * self.width + x]]
     
     def set_cell(self, x: int, y: int, color: Optional[Tuple[int, int, int]]) -> None:
         """Set the color value at the specified grid position.
@@ -74,35 +115,167 @@ class Playfield:
         if not (0 <= y < self.height):
             raise IndexError(f"Row index {y} out of bounds (0-{self.height-1})")
         
-        self.grid[y][x] = color
+        occupied = 0 if color is None else 1
+        self.cells[y * self.width + x] = _intern_color(color)
+        self._dirty.add((x, y))
+        
+        # Only empty <-> occupied transitions change the row's fill count
+        delta = occupied - (self.row_bits[y] >> x & 1)
+        if delta:
+            self.row_bits[y] ^= 1 << x
+            self._set_filled_count(y, self.filled_count[y] + delta)
+    
+    def fill_row(self, y: int, color: Optional[Tuple[int, int, int]]) -> None:
+        """Set every cell in a row to the same color.
+        
+        Equivalent to calling set_cell for each column of the row, but
+        replaces the whole row in a single list operation.
+        
+        Args:
+            y: Row index (0-19)
+            color: RGB color tuple to set, or None to clear the row
+        
+        Raises:
+            IndexError: If y is out of bounds
+        """
+        if not (0 <= y < self.height):
+            raise IndexError(f"Row index {y} out of bounds (0-{self.height-1})")
+        
+        start = y * self.width
+        self.cells[start:start + self.width] = [_intern_color(color)] * self.width
+        self._dirty.update((x, y) for x in range(self.width))
+        if color is None:
+            self.row_bits[y] = 0
+            self._set_filled_count(y, 0)
+        else:
+            self.row_bits[y] = _FULL_ROW_BITS
+            self._set_filled_count(y, self.width)
     
-    def is_valid_position(self, tetromino: 'Tetromino') -> bool:
+    def get_occupied_cells(self) -> List[Tuple[int, int, Tuple[int, int, int]]]:
+        """Get the position and color of every occupied cell.
+        
+        Empty rows are skipped and occupied cells within a row are found
+        from the set bits of its row bitmap, so empty cells are never
+        visited one by one.
+        
+        Returns:
+            List of (x, y, color) tuples in row-major order
+        """
+        width = self.width
+        cells = self.cells
+        occupied = []
+        
+        for y, bits in enumerate(self.row_bits):
+            start = y * width
+            while bits:
+                # Lowest set bit first, so cells come out left to right
+                low = bits & -bits
+                x = low.bit_length() - 1
+                occupied.append((x, y, _COLORS_BY_ID[cells[start + x]]))
+                bits ^= low
+        
+        return occupied
+    
+    def is_valid_position(self, tetromino: 'Tetromino', dx: int = 0, dy: int = 0) -> bool:
         """Check if a tetromino position is valid (no collisions).
         
         A position is valid if all blocks of the tetromino:
         1. Are within the playfield boundaries (0 <= x < 10, 0 <= y < 20)
         2. Do not overlap with any stopped blocks in the grid
         
+        The optional offset checks the position the tetromino would have
+        after tetromino.move(dx, dy), without creating the moved tetromino.
+        
         Args:
             tetromino: The tetromino to check
+            dx: Horizontal offset to apply before checking
+            dy: Vertical offset to apply before checking
         
         Returns:
             True if the position is valid, False otherwise
         """
-        blocks = tetromino.get_absolute_blocks()
+        # Check boundary collisions for the whole piece at once
+        left, top, right, bottom = tetromino.get_bounds()
+        if (left + dx < 0 or top + dy < 0
+                or right + dx >= self.width or bottom + dy >= self.height):
+            return False
         
-        for x, y in blocks:
-            # Check boundary collisions
-            if x < 0 or x >= self.width:
-                return False
-            if y < 0 or y >= self.height:
-                return False
-            
-            # Check collision with stopped blocks
-            if self.grid[y][x] is not None:
-                return False
-        
-        return True
+        # Check collision with stopped blocks
+        return not self.collides(tetromino, dx, dy)
+    
+    def collides(self, tetromino: 'Tetromino', dx: int = 0, dy: int = 0) -> bool:
+        """Check if a tetromino overlaps any stopped blocks.
+        
+        Each row of the piece's shape mask is compared against the matching
+        row bitmap in a single AND, rather than checking block by block.
+        
+        Args:
+            tetromino: The tetromino to check; all of its blocks (shifted by
+                the offset) must lie within the playfield boundaries
+            dx: Horizontal offset to apply before checking
+            dy: Vertical offset to apply before checking
+        
+        Returns:
+            True if any block of the tetromino overlaps a stopped block
+        """
+        bits = tetromino.get_shape_bits()
+        x = tetromino.x + dx
+        y = tetromino.y + dy
+        row_bits = self.row_bits
+        
+        while bits:
+            piece_row = bits & 0xF
+            if piece_row:
+                # Align the playfield row so that column x becomes bit 0
+                row = row_bits[y] >> x if x >= 0 else row_bits[y] << -x
+                if row & piece_row:
+                    return True
+            bits >>= 4
+            y += 1
+        
+        return False
+    
+    def drop_distance(self, tetromino: 'Tetromino') -> int:
+        """Count how many rows a tetromino can fall before it lands.
+        
+        Equivalent to moving the tetromino down one row at a time while the
+        new position is valid, but works on the row bitmaps directly
+        instead of creating and checking a tetromino per row.
+        
+        Args:
+            tetromino: The tetromino to drop
+        
+        Returns:
+            Largest n such that the tetromino moved down by 1..n rows is
+            valid at every step (0 if it cannot move down at all)
+        """
+        left, top, right, bottom = tetromino.get_bounds()
+        if left < 0 or right >= self.width or top + 1 < 0:
+            return 0
+        
+        # The piece's non-empty rows as playfield row masks
+        x = tetromino.x
+        bits = tetromino.get_shape_bits()
+        piece_rows = []
+        dy = 0
+        while bits:
+            piece_row = bits & 0xF
+            if piece_row:
+                piece_rows.append((dy, piece_row << x if x >= 0 else piece_row >> -x))
+            bits >>= 4
+            dy += 1
+        
+        row_bits = self.row_bits
+        y = tetromino.y
+        distance = 0
+        while bottom + distance + 1 < self.height:
+            y += 1
+            for dy, piece_row in piece_rows:
+                if row_bits[y + dy] & piece_row:
+                    return distance
+            distance += 1
+        
+        return distance
     
     def add_tetromino(self, tetromino: 'Tetromino') -> None:
         """Lock a tetromino into the playfield by adding its blocks to the grid.
@@ -119,32 +292,30 @@ class Playfield:
             Modifies the grid by setting cells to the tetromino's color
         """
         blocks = tetromino.get_absolute_blocks()
-        color = tetromino.color
+        color_id = _intern_color(tetromino.color)
         
         for x, y in blocks:
             # Set each block position to the tetromino's color
             # Note: We assume the tetromino is in a valid position
             # (this should be verified by the caller before locking)
             if 0 <= x < self.width and 0 <= y < self.height:
-                self.grid[y][x] = color
+                self.cells[y * self.width + x] = color_id
+                self._dirty.add((x, y))
+                if not self.row_bits[y] >> x & 1:
+                    self.row_bits[y] |= 1 << x
+                    self._set_filled_count(y, self.filled_count[y] + 1)
     
     def get_complete_rows(self) -> list[int]:
         """Find all rows that are completely filled with blocks.
         
         A row is complete when all 10 positions in that row contain
-        non-None color values (i.e., all cells are occupied).
+        non-None color values (i.e., all cells are occupied). The set of
+        complete rows is maintained as cells change, so no scan is needed.
         
         Returns:
             List of row indices (0-19) that are complete, in ascending order
         """
-        complete_rows = []
-        
-        for y in range(self.height):
-            # Check if all cells in this row are occupied
-            if all(self.grid[y][x] is not None for x in range(self.width)):
-                complete_rows.append(y)
-        
-        return complete_rows
+        return sorted(self._complete)
     
     def clear_rows(self, row_indices: list[int]) -> None:
         """Clear specified rows and shift blocks above them down.
@@ -153,29 +324,72 @@ class Playfield:
         all rows above each cleared row down by one position. The process
         preserves the color and position of blocks when moving rows downward.
         
-        When multiple rows are cleared, they are processed from bottom to top
-        to ensure correct gravity behavior.
+        Each cleared row is a contiguous slice of the flat cell list, so rows
+        are removed with slice deletion and the matching number of empty rows
+        is prepended in one step; the work is per row rather than per cell.
         
         Args:
             row_indices: List of row indices to clear (can be in any order)
         
+        Raises:
+            IndexError: If any row index is out of bounds; the playfield is
+                left unchanged
+        
         Side effects:
             Modifies the grid by removing rows and shifting blocks down
         """
         if not row_indices:
             return
         
-        # Sort row indices in ascending order to process from top to bottom
-        sorted_rows = sorted(set(row_indices))
+        width = self.width
+        cleared = sorted(set(row_indices))
         
-        # Remove all the specified rows
-        for row_index in reversed(sorted_rows):
-            del self.grid[row_index]
+        # Slice deletion ignores out-of-range rows, so validate them all
+        # before changing anything
+        if not (0 <= cleared[0] and cleared[-1] < self.height):
+            bad = cleared[0] if cleared[0] < 0 else cleared[-1]
+            raise IndexError(f"Row index {bad} out of bounds (0-{self.height-1})")
+        
+        # Remove the rows from the bottom up so earlier slice offsets stay valid
+        for y in reversed(cleared):
+            start = y * width
+            del self.cells[start:start + width]
         
         # Add empty rows at the top to maintain grid size
-        num_cleared = len(sorted_rows)
-        for _ in range(num_cleared):
-            self.grid.insert(0, [None for _ in range(self.width)])
+        self.cells[:0] = [0] * (width * len(cleared))
+        
+        # Shift the per-row counts the same way and recompute complete rows
+        for y in reversed(cleared):
+            del self.filled_count[y]
+            del self.row_bits[y]
+        self.filled_count[:0] = [0] * len(cleared)
+        self.row_bits[:0] = [0] * len(cleared)
+        self._complete = {
+            y for y, count in enumerate(self.filled_count) if count == width
+        }
+        
+        # Every row down to the lowest cleared one has new contents
+        self._dirty.update(
+            (x, y) for y in range(cleared[-1] + 1) for x in range(width)
+        )
+    
+    def clear_complete_rows(self) -> int:
+        """Clear every complete row and shift the blocks above them down.
+        
+        Equivalent to passing get_complete_rows() to clear_rows.
+        
+        Returns:
+            Number of rows cleared (0 if no row was complete)
+        
+        Side effects:
+            Modifies the grid by removing rows and shifting blocks down
+        """
+        if not self._complete:
+            return 0
+        
+        rows = list(self._complete)
+        self.clear_rows(rows)
+        return len(rows)
     
     def is_game_over(self) -> bool:
         """Check if the game is over by detecting blocks in the top row.
@@ -188,4 +402,31 @@ class Playfield:
             True if any block exists in the top row, False otherwise
         """
         # Check if any cell in the top row (y=0) is occupied
-        return any(self.grid[0][x] is not None for x in range(self.width))
+        return self.filled_count[0] > 0
+    
+    def take_dirty_cells(self) -> Set[Tuple[int, int]]:
+        """Return the cells changed since the last call and reset the set.
+        
+        This lets a renderer keep a persistent image of the playfield and
+        redraw only what changed. It only affects this bookkeeping, never
+        the grid contents.
+        
+        Returns:
+            Set of (x, y) positions whose contents may have changed
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+    
+    def _set_filled_count(self, y: int, count: int) -> None:
+        """Update a row's fill count and its membership in the complete set.
+        
+        Args:
+            y: Row index (0-19)
+            count: New number of occupied cells in the row
+        """
+        self.filled_count[y] = count
+        if count == self.width:
+            self._complete.add(y)
+        else:
+            self._complete.discard(y)
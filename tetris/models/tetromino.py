@@ -5,12 +5,15 @@ with their rotation states, colors, and movement operations. All operations are
 immutable - they return new Tetromino instances rather than modifying existing ones.
 """
 
+from dataclasses import dataclass, field
 from typing import List, Tuple
 
 # Type aliases for clarity
 Position = Tuple[int, int]
 Color = Tuple[int, int, int]
 BlockList = List[Position]
+BlockTuple = Tuple[Position, ...]
+Bounds = Tuple[int, int, int, int]
 
 
 # Color constants for each tetromino type
@@ -100,12 +103,44 @@ TETROMINO_SHAPES = {
 }
 
 
+# Flat lookup table of every shape's rotation states, indexed by
+# shape_index * 4 + rotation. Entries are tuples so get_blocks can hand out
+# the shared table entry without copying it.
+_SHAPE_INDEX = {shape_type: index for index, shape_type in enumerate(TETROMINO_SHAPES)}
+_SHAPE_TABLE: Tuple[BlockTuple, ...] = tuple(
+    tuple(rotation_blocks)
+    for shape_states in TETROMINO_SHAPES.values()
+    for rotation_blocks in shape_states
+)
+
+# Bounding box (min_x, min_y, max_x, max_y) of each _SHAPE_TABLE entry, so
+# boundary checks can test a whole piece at once instead of block by block
+_SHAPE_BOUNDS: Tuple[Bounds, ...] = tuple(
+    (
+        min(bx for bx, _ in blocks),
+        min(by for _, by in blocks),
+        max(bx for bx, _ in blocks),
+        max(by for _, by in blocks),
+    )
+    for blocks in _SHAPE_TABLE
+)
+
+# 16-bit mask of each _SHAPE_TABLE entry over its 4×4 box, with bit
+# (by * 4 + bx) set for every block; each 4-bit group is one row of the piece
+_SHAPE_BITS: Tuple[int, ...] = tuple(
+    sum(1 << (by * 4 + bx) for bx, by in blocks)
+    for blocks in _SHAPE_TABLE
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Tetromino:
     """Represents a tetromino piece with shape, color, position, and rotation.
     
     Tetrominoes are immutable - all operations (move, rotate) return new instances
     rather than modifying the existing instance. This makes the code easier to reason
-    about and safer for testing.
+    about and safer for testing. Equality, hashing and repr are generated from
+    shape_type, x, y and rotation.
     
     Attributes:
         shape_type: One of 'I', 'O', 'T', 'L', 'J', 'S', 'Z'
@@ -113,55 +148,86 @@ class Tetromino:
         y: Grid y-coordinate (row) of the tetromino's center
         rotation: Rotation state (0, 1, 2, or 3 representing 0°, 90°, 180°, 270°)
         color: RGB color tuple for rendering
+    
+    Raises:
+        ValueError: If shape_type is not one of the seven valid types
+        ValueError: If rotation is not in range 0-3
     """
+    shape_type: str
+    x: int
+    y: int
+    rotation: int = 0
+    color: Color = field(init=False, repr=False, compare=False)
+    _shape_idx: int = field(init=False, repr=False, compare=False)
+    _abs: BlockTuple = field(init=False, repr=False, compare=False)
     
-    def __init__(self, shape_type: str, x: int, y: int, rotation: int = 0):
-        """Initialize a tetromino with the given shape, position, and rotation.
-        
-        Args:
-            shape_type: One of 'I', 'O', 'T', 'L', 'J', 'S', 'Z'
-            x: Grid x-coordinate (column)
-            y: Grid y-coordinate (row)
-            rotation: Rotation state (0-3), defaults to 0
-            
-        Raises:
-            ValueError: If shape_type is not one of the seven valid types
-            ValueError: If rotation is not in range 0-3
-        """
-        if shape_type not in TETROMINO_SHAPES:
+    def __post_init__(self) -> None:
+        """Validate the shape and rotation and derive the cached fields."""
+        # One lookup both validates the shape and finds its table index
+        shape_idx = _SHAPE_INDEX.get(self.shape_type, -1)
+        if shape_idx < 0:
             raise ValueError(
-                f"Invalid shape_type '{shape_type}'. "
+                f"Invalid shape_type '{self.shape_type}'. "
                 f"Must be one of: {', '.join(TETROMINO_SHAPES.keys())}"
             )
         
-        if rotation not in (0, 1, 2, 3):
-            raise ValueError(f"Invalid rotation {rotation}. Must be 0, 1, 2, or 3")
+        if self.rotation not in (0, 1, 2, 3):
+            raise ValueError(f"Invalid rotation {self.rotation}. Must be 0, 1, 2, or 3")
         
-        self.shape_type = shape_type
-        self.x = x
-        self.y = y
-        self.rotation = rotation
-        self.color = TETROMINO_COLORS[shape_type]
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, 'color', TETROMINO_COLORS[self.shape_type])
+        object.__setattr__(self, '_shape_idx', shape_idx)
+        
+        # The position never changes, so the absolute blocks are computed once
+        x = self.x
+        y = self.y
+        object.__setattr__(self, '_abs', tuple(
+            (x + bx, y + by)
+            for bx, by in _SHAPE_TABLE[shape_idx * 4 + self.rotation]
+        ))
     
-    def get_blocks(self) -> BlockList:
+    def get_blocks(self) -> BlockTuple:
         """Get the relative block positions for the current rotation state.
         
         Returns:
-            List of (x, y) tuples representing block positions relative to center
+            Tuple of (x, y) tuples representing block positions relative to
+            center. The tuple is shared between all tetrominoes of the same
+            shape and rotation.
         """
-        return TETROMINO_SHAPES[self.shape_type][self.rotation]
+        return _SHAPE_TABLE[self._shape_idx * 4 + self.rotation]
     
-    def get_absolute_blocks(self) -> BlockList:
+    def get_absolute_blocks(self) -> BlockTuple:
         """Get the absolute grid positions of all blocks.
         
-        Calculates the actual grid coordinates by adding the tetromino's position
-        to each relative block offset.
+        The actual grid coordinates (the tetromino's position added to each
+        relative block offset) are computed once at construction time.
         
         Returns:
-            List of (x, y) tuples representing absolute grid positions
+            Tuple of (x, y) tuples representing absolute grid positions
         """
-        blocks = self.get_blocks()
-        return [(self.x + bx, self.y + by) for bx, by in blocks]
+        return self._abs
+    
+    def get_shape_bits(self) -> int:
+        """Get the block mask for the current shape and rotation.
+        
+        Returns:
+            16-bit mask with bit (by * 4 + bx) set for each relative block
+            offset (bx, by); bits 0-3 are the piece's first row, 4-7 the
+            second, and so on
+        """
+        return _SHAPE_BITS[self._shape_idx * 4 + self.rotation]
+    
+    def get_bounds(self) -> Bounds:
+        """Get the absolute bounding box of the tetromino's blocks.
+        
+        Returns:
+            Tuple of (left, top, right, bottom) grid coordinates, with right
+            and bottom inclusive
+        """
+        min_x, min_y, max_x, max_y = _SHAPE_BOUNDS[self._shape_idx * 4 + self.rotation]
+        x = self.x
+        y = self.y
+        return x + min_x, y + min_y, x + max_x, y + max_y
     
     def move(self, dx: int, dy: int) -> 'Tetromino':
         """Return a new tetromino moved by the given offset.
@@ -176,12 +242,7 @@ class Tetromino:
         Returns:
             New Tetromino instance at the moved position
         """
-        return Tetromino(
-            shape_type=self.shape_type,
-            x=self.x + dx,
-            y=self.y + dy,
-            rotation=self.rotation
-        )
+        return self._derive(self.x + dx, self.y + dy, self.rotation)
     
     def rotate_clockwise(self) -> 'Tetromino':
         """Return a new tetromino rotated 90 degrees clockwise.
@@ -193,28 +254,26 @@ class Tetromino:
         Returns:
             New Tetromino instance with rotation incremented by 1 (mod 4)
         """
-        new_rotation = (self.rotation + 1) % 4
-        return Tetromino(
-            shape_type=self.shape_type,
-            x=self.x,
-            y=self.y,
-            rotation=new_rotation
-        )
-    
-    def __repr__(self) -> str:
-        """Return a string representation for debugging."""
-        return (
-            f"Tetromino(shape_type='{self.shape_type}', "
-            f"x={self.x}, y={self.y}, rotation={self.rotation})"
-        )
+        return self._derive(self.x, self.y, (self.rotation + 1) & 3)
     
-    def __eq__(self, other: object) -> bool:
-        """Check equality based on shape, position, and rotation."""
-        if not isinstance(other, Tetromino):
-            return NotImplemented
-        return (
-            self.shape_type == other.shape_type
-            and self.x == other.x
-            and self.y == other.y
-            and self.rotation == other.rotation
-        )
+    def _derive(self, x: int, y: int, rotation: int) -> 'Tetromino':
+        """Create a tetromino of the same shape without re-validating it.
+        
+        The shape was validated when this tetromino was created and the
+        callers only pass rotations in 0-3, so the fields are assigned
+        directly instead of going through __init__ and __post_init__.
+        """
+        shape_idx = self._shape_idx
+        derived = object.__new__(Tetromino)
+        setattr_ = object.__setattr__
+        setattr_(derived, 'shape_type', self.shape_type)
+        setattr_(derived, 'x', x)
+        setattr_(derived, 'y', y)
+        setattr_(derived, 'rotation', rotation)
+        setattr_(derived, 'color', self.color)
+        setattr_(derived, '_shape_idx', shape_idx)
+        setattr_(derived, '_abs', tuple(
+            (x + bx, y + by)
+            for bx, by in _SHAPE_TABLE[shape_idx * 4 + rotation]
+        ))
+        return derived
@@ -5,7 +5,7 @@ graphics rendering. The renderer is responsible for drawing the playfield,
 tetrominoes, score, and other visual elements to the screen.
 """
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 import pygame
 
@@ -54,6 +54,18 @@ class Renderer:
         title_font: Large font for titles
         score_font: Medium font for score display
         text_font: Small font for general text
+        _block_cache: Pre-rendered block surfaces (fill + border) keyed by color
+        _piece_cache: Pre-rendered tetromino sprites keyed by
+              (shape_type, rotation, color)
+        _playfield_surface: Persistent image of the stopped blocks, updated
+              only where the playfield reports changed cells
+        _rendered_playfield: The playfield currently shown on
+              _playfield_surface
+        _playfield_rect: Screen area covered by the playfield, used to clip
+              the active tetromino
+        _score_text: The last rendered score and its text surface
+        _background: Screen-sized image of the background and the playfield
+              border, drawn once and blitted at the start of every frame
     """
     
     def __init__(self, screen: pygame.Surface) -> None:
@@ -71,6 +83,29 @@ class Renderer:
         self.title_font = pygame.font.Font(None, 72)   # Large for title
         self.score_font = pygame.font.Font(None, 36)   # Medium for score
         self.text_font = pygame.font.Font(None, 24)    # Small for text
+        
+        # Block surfaces are rendered once per color and then only blitted
+        self._block_cache: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._piece_cache: dict[tuple[str, int, tuple[int, int, int]], pygame.Surface] = {}
+        
+        self._playfield_surface = self.to_display_format(pygame.Surface(
+            (PLAYFIELD_WIDTH * self.block_size, PLAYFIELD_HEIGHT * self.block_size)
+        ))
+        self._playfield_surface.fill(BACKGROUND_COLOR)
+        self._rendered_playfield: Optional['Playfield'] = None
+        self._playfield_rect = pygame.Rect(
+            self.offset_x,
+            self.offset_y,
+            PLAYFIELD_WIDTH * self.block_size,
+            PLAYFIELD_HEIGHT * self.block_size
+        )
+        self._score_text: Optional[tuple[int, pygame.Surface]] = None
+        
+        # The background and border never change, so they are drawn only once
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill(BACKGROUND_COLOR)
+        self.render_grid_lines(background)
+        self._background = self.to_display_format(background)
     
     def grid_to_screen(self, grid_x: int, grid_y: int) -> tuple[int, int]:
         """Convert grid coordinates to screen pixel coordinates.
@@ -112,26 +147,119 @@ class Renderer:
     def draw_block(self, x: int, y: int, color: tuple[int, int, int]) -> None:
         """Draw a single block at grid position (x, y).
         
+        Blits the cached block surface for the color instead of drawing
+        the fill and border rectangles again.
+        
         Args:
             x: Grid column (0-9)
             y: Grid row (0-19)
             color: RGB color tuple for the block
         """
-        screen_x, screen_y = self.grid_to_screen(x, y)
+        self.screen.blit(self.get_block_surface(color), self.grid_to_screen(x, y))
+    
+    def to_display_format(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convert a surface to the pixel format of the display.
+        
+        Surfaces in the display's format blit without per-pixel conversion.
+        Surfaces with per-pixel alpha keep their alpha channel. If no display
+        mode has been set (e.g. in tests), the surface is returned unchanged.
+        
+        Args:
+            surface: The surface to convert
+        
+        Returns:
+            The converted surface, or the original one without a display
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+    
+    def get_block_surface(self, color: tuple[int, int, int]) -> pygame.Surface:
+        """Return the pre-rendered block surface for a color.
+        
+        The surface holds the block's fill and border in the display's
+        pixel format. It is created on first use, then cached for the
+        lifetime of the renderer.
+        
+        Args:
+            color: RGB color tuple for the block
+        
+        Returns:
+            A block_size × block_size surface with fill and border baked in
+        """
+        surface = self._block_cache.get(color)
+        if surface is None:
+            surface = pygame.Surface((self.block_size, self.block_size))
+            rect = pygame.Rect(0, 0, self.block_size, self.block_size)
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, BLACK, rect, 1)
+            surface = self.to_display_format(surface)
+            self._block_cache[color] = surface
+        return surface
+    
+    def get_piece_surface(self, tetromino: 'Tetromino') -> pygame.Surface:
+        """Return the pre-rendered sprite for a tetromino's shape and rotation.
+        
+        The sprite is a transparent 4×4-block surface with the piece's blocks
+        drawn at their relative offsets, so blitting it at the tetromino's
+        grid position draws the whole piece. Sprites are created on first
+        use and cached for the lifetime of the renderer.
+        
+        Args:
+            tetromino: The tetromino whose sprite to return
+        
+        Returns:
+            A (4 * block_size) × (4 * block_size) surface with per-pixel alpha
+        """
+        key = (tetromino.shape_type, tetromino.rotation, tetromino.color)
+        surface = self._piece_cache.get(key)
+        if surface is None:
+            size = 4 * self.block_size
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            block = self.get_block_surface(tetromino.color)
+            for bx, by in tetromino.get_blocks():
+                surface.blit(block, (bx * self.block_size, by * self.block_size))
+            surface = self.to_display_format(surface)
+            self._piece_cache[key] = surface
+        return surface
+    
+    def blit_blocks(self, blocks: list[tuple[pygame.Surface, tuple[int, int]]],
+                    target: Optional[pygame.Surface] = None) -> None:
+        """Draw a batch of block surfaces in a single call.
+        
+        Uses Surface.fblits where available and falls back to Surface.blits
+        on pygame versions that predate it.
+        
+        Args:
+            blocks: List of (surface, (x, y)) pairs to draw
+            target: Surface to draw on, defaults to the screen
+        """
+        if not blocks:
+            return
         
-        # Draw filled rectangle for the block
-        rect = pygame.Rect(screen_x, screen_y, self.block_size, self.block_size)
-        pygame.draw.rect(self.screen, color, rect)
+        if target is None:
+            target = self.screen
         
-        # Draw border for visual separation
-        pygame.draw.rect(self.screen, BLACK, rect, 1)
+        fblits = getattr(target, 'fblits', None)
+        if fblits is not None:
+            fblits(blocks)
+        else:
+            target.blits(blocks, doreturn=False)
     
-    def render_grid_lines(self) -> None:
+    def render_grid_lines(self, target: Optional[pygame.Surface] = None) -> None:
         """Draw playfield border and grid lines.
         
         Draws a white border around the playfield to clearly delineate
         the game boundaries.
+        
+        Args:
+            target: Surface to draw on, defaults to the screen
         """
+        if target is None:
+            target = self.screen
+        
         # Calculate border rectangle
         border_rect = pygame.Rect(
             self.offset_x - 2,
@@ -141,70 +269,92 @@ class Renderer:
         )
         
         # Draw white border (2 pixels thick)
-        pygame.draw.rect(self.screen, WHITE, border_rect, 2)
+        pygame.draw.rect(target, WHITE, border_rect, 2)
     
     def render_playfield(self, playfield: 'Playfield') -> None:
         """Draw all stopped blocks in the playfield.
         
-        Iterates through the playfield grid and draws each occupied cell
-        with its assigned color.
+        The stopped blocks are kept on a persistent playfield surface. Only
+        the cells the playfield reports as changed since the last frame are
+        redrawn (or erased) on it, and the surface is then drawn to the
+        screen in a single blit. A playfield that was not rendered before
+        (e.g. after a game reset) is redrawn from scratch.
         
         Args:
             playfield: The Playfield instance to render
         """
-        # Draw each occupied cell in the grid
-        for y in range(PLAYFIELD_HEIGHT):
-            for x in range(PLAYFIELD_WIDTH):
-                cell_color = playfield.get_cell(x, y)
-                if cell_color is not None:
-                    # Cell is occupied - draw the block
-                    self.draw_block(x, y, cell_color)
+        surface = self._playfield_surface
+        size = self.block_size
+        blocks = []
+        
+        if playfield is not self._rendered_playfield:
+            # New playfield - repaint its occupied cells on a blank surface
+            playfield.take_dirty_cells()
+            surface.fill(BACKGROUND_COLOR)
+            for x, y, color in playfield.get_occupied_cells():
+                blocks.append((self.get_block_surface(color), (x * size, y * size)))
+            self._rendered_playfield = playfield
+        else:
+            # Same playfield - update only the cells that changed
+            for x, y in playfield.take_dirty_cells():
+                color = playfield.get_cell(x, y)
+                if color is None:
+                    surface.fill(BACKGROUND_COLOR, (x * size, y * size, size, size))
+                else:
+                    blocks.append((self.get_block_surface(color), (x * size, y * size)))
+        
+        self.blit_blocks(blocks, surface)
+        self.screen.blit(surface, (self.offset_x, self.offset_y))
 
     def render_tetromino(self, tetromino: 'Tetromino') -> None:
         """Draw the active tetromino.
         
-        Draws all blocks of the tetromino using its color.
+        Blits the cached sprite for the tetromino's shape and rotation in a
+        single call, clipped to the playfield so that blocks outside the
+        visible area (e.g. above the top row) are not drawn.
         
         Args:
             tetromino: The Tetromino instance to render
         """
-        # Get absolute block positions
-        blocks = tetromino.get_absolute_blocks()
-        color = tetromino.color
-        
-        # Draw each block
-        for x, y in blocks:
-            # Only draw blocks that are within the visible playfield
-            if 0 <= x < PLAYFIELD_WIDTH and 0 <= y < PLAYFIELD_HEIGHT:
-                self.draw_block(x, y, color)
+        screen = self.screen
+        previous_clip = screen.get_clip()
+        screen.set_clip(self._playfield_rect)
+        screen.blit(self.get_piece_surface(tetromino),
+                    (self.offset_x + tetromino.x * self.block_size,
+                     self.offset_y + tetromino.y * self.block_size))
+        screen.set_clip(previous_clip)
 
     def render_score(self, score: int) -> None:
         """Display the current score at the top of the screen.
         
+        The score text is only rasterized again when the score changes;
+        frames with an unchanged score reuse the previous text surface.
+        
         Args:
             score: The current score value to display
         """
-        score_text = f"Score: {score}"
+        if self._score_text is None or self._score_text[0] != score:
+            self._score_text = (
+                score,
+                self.score_font.render(f"Score: {score}", True, TEXT_COLOR)
+            )
+        text_surface = self._score_text[1]
+        
         # Draw score at top center of screen
-        self.draw_text(
-            score_text,
-            self.score_font,
-            TEXT_COLOR,
-            SCREEN_WIDTH // 2,
-            20,
-            center=True
-        )
+        text_rect = text_surface.get_rect()
+        text_rect.center = (SCREEN_WIDTH // 2, 20)
+        self.screen.blit(text_surface, text_rect)
 
     def render_game(self, game_state: 'GameState') -> None:
         """Render the complete game screen.
         
         This is the main rendering method that coordinates all rendering
         operations. It follows the proper rendering order:
-        1. Clear screen
-        2. Draw grid lines
-        3. Draw playfield (stopped blocks)
-        4. Draw active tetromino
-        5. Draw score
+        1. Draw the cached background (clears the screen and draws the
+           playfield border in one blit)
+        2. Draw playfield (stopped blocks)
+        3. Draw active tetromino
+        4. Draw score
         
         Args:
             game_state: The GameState instance to render
@@ -212,20 +362,17 @@ class Renderer:
         Side effects:
             Draws to the screen surface (does not call pygame.display.flip)
         """
-        # 1. Clear screen with background color
-        self.screen.fill(BACKGROUND_COLOR)
-        
-        # 2. Draw playfield border
-        self.render_grid_lines()
+        # 1. Clear screen and draw playfield border
+        self.screen.blit(self._background, (0, 0))
         
-        # 3. Draw stopped blocks from playfield
+        # 2. Draw stopped blocks from playfield
         self.render_playfield(game_state.playfield)
         
-        # 4. Draw active tetromino (if it exists)
+        # 3. Draw active tetromino (if it exists)
         if game_state.active_tetromino is not None:
             self.render_tetromino(game_state.active_tetromino)
         
-        # 5. Draw score
+        # 4. Draw score
         self.render_score(game_state.score)
         
         # Note: pygame.display.flip() should be called by the main loop,
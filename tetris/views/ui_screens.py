@@ -5,8 +5,9 @@ and transitions between them (start screen, game screen, game over screen,
 name entry screen, high scores screen).
 """
 
+import string
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
 
 import pygame
 
@@ -25,11 +26,19 @@ BACKGROUND_COLOR = (20, 20, 20)
 TEXT_COLOR = (255, 255, 255)
 HIGHLIGHT_COLOR = (255, 255, 0)
 
+# Maximum number of rendered text surfaces kept by UIManager.draw_text
+_TEXT_CACHE_SIZE = 256
+
+# Characters accepted in player names (printable ASCII, which the default
+# font can render), checked with a single set lookup per keystroke
+_NAME_CHARACTERS = frozenset(string.ascii_letters + string.digits + string.punctuation + " ")
+
 
 class Screen(Enum):
     """Enumeration of all possible game screens."""
     START = auto()
     GAME = auto()
+    GAME_OVER_OVERLAY = auto()
     GAME_OVER = auto()
     NAME_ENTRY = auto()
     HIGH_SCORES = auto()
@@ -47,7 +56,9 @@ class UIManager:
         title_font: Large font for titles
         score_font: Medium font for scores
         text_font: Small font for general text
+        small_font: Smallest font for high score lists
         player_name: Current name being entered (for name entry screen)
+        _text_cache: Rendered text surfaces keyed by (text, font, color)
     """
     
     def __init__(self, screen: pygame.Surface) -> None:
@@ -63,6 +74,10 @@ class UIManager:
         self.title_font = pygame.font.Font(None, 72)   # Large for titles
         self.score_font = pygame.font.Font(None, 48)   # Medium for scores
         self.text_font = pygame.font.Font(None, 32)    # Small for text
+        self.small_font = pygame.font.Font(None, 28)   # Smallest for score lists
+        
+        # Text only needs to be rasterized once; later frames reuse the surface
+        self._text_cache: Dict[Tuple[str, pygame.font.Font, Tuple[int, int, int]], pygame.Surface] = {}
         
         # Name entry state
         self.player_name = ""
@@ -84,6 +99,10 @@ class UIManager:
                   center: bool = False) -> None:
         """Draw text at specified position.
         
+        The rendered text surface is cached, so text drawn on every frame is
+        only rasterized the first time. The cache is emptied once it holds
+        _TEXT_CACHE_SIZE surfaces.
+        
         Args:
             text: Text string to render
             font: Pygame font to use
@@ -92,7 +111,13 @@ class UIManager:
             y: Y coordinate
             center: If True, center text at (x, y); if False, use (x, y) as top-left
         """
-        text_surface = font.render(text, True, color)
+        key = (text, font, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            text_surface = font.render(text, True, color)
+            self._text_cache[key] = text_surface
         text_rect = text_surface.get_rect()
         
         if center:
@@ -148,7 +173,6 @@ class UIManager:
             # Draw top 5 scores
             start_y = 260
             line_height = 35
-            small_font = pygame.font.Font(None, 28)
             
             for i, entry in enumerate(high_scores[:5]):  # Top 5 only
                 rank = f"{i + 1}."
@@ -159,7 +183,7 @@ class UIManager:
                 rank_name = f"{rank:2} {name}"
                 self.draw_text(
                     rank_name,
-                    small_font,
+                    self.small_font,
                     TEXT_COLOR,
                     SCREEN_WIDTH // 2 - 80,
                     start_y + i * line_height,
@@ -169,7 +193,7 @@ class UIManager:
                 # Draw score (right-aligned)
                 self.draw_text(
                     score,
-                    small_font,
+                    self.small_font,
                     HIGHLIGHT_COLOR,
                     SCREEN_WIDTH // 2 + 80,
                     start_y + i * line_height,
@@ -306,7 +330,6 @@ class UIManager:
         # Draw high scores list
         start_y = 180
         line_height = 35
-        small_font = pygame.font.Font(None, 28)
         
         if not high_scores:
             # No high scores yet
@@ -329,7 +352,7 @@ class UIManager:
                 rank_name = f"{rank:3} {name}"
                 self.draw_text(
                     rank_name,
-                    small_font,
+                    self.small_font,
                     TEXT_COLOR,
                     SCREEN_WIDTH // 2 - 80,
                     start_y + i * line_height,
@@ -339,7 +362,7 @@ class UIManager:
                 # Draw score (right-aligned)
                 self.draw_text(
                     score,
-                    small_font,
+                    self.small_font,
                     HIGHLIGHT_COLOR,
                     SCREEN_WIDTH // 2 + 80,
                     start_y + i * line_height,
@@ -416,6 +439,6 @@ class UIManager:
                 # Add character (limit name length)
                 if len(self.player_name) < 20:
                     char = event.unicode
-                    # Only allow printable characters
-                    if char.isprintable() and char not in ['\r', '\n', '\t']:
+                    # Only allow printable ASCII characters
+                    if char in _NAME_CHARACTERS:
                         self.player_name += char